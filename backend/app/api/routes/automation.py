@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import asyncio
-
 from fastapi import APIRouter, Query, Request
-from fastapi.responses import JSONResponse
 
+from ...core.executor import run_blocking
+from ...core.serialization import FastJSONResponse, read_json
 from ...core.state import require_rule_service
 
 router = APIRouter()
@@ -20,35 +19,35 @@ async def api_automation_rules(request: Request):
 async def api_automation_create_rule(request: Request):
     service = require_rule_service(request)
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
     try:
-        rule = await asyncio.get_event_loop().run_in_executor(None, service.create_rule, body)
+        rule = await run_blocking(service.create_rule, body)
         return {"success": True, "rule": rule}
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.put("/api/automation/rules/{rule_id}")
 async def api_automation_update_rule(rule_id: str, request: Request):
     service = require_rule_service(request)
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
-    rule = await asyncio.get_event_loop().run_in_executor(None, service.update_rule, rule_id, body)
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+    rule = await run_blocking(service.update_rule, rule_id, body)
     if not rule:
-        return JSONResponse(status_code=404, content={"success": False, "error": "Rule not found"})
+        return FastJSONResponse(status_code=404, content={"success": False, "error": "Rule not found"})
     return {"success": True, "rule": rule}
 
 
 @router.delete("/api/automation/rules/{rule_id}")
 async def api_automation_delete_rule(rule_id: str, request: Request):
     service = require_rule_service(request)
-    rule = await asyncio.get_event_loop().run_in_executor(None, service.delete_rule, rule_id)
+    rule = await run_blocking(service.delete_rule, rule_id)
     if not rule:
-        return JSONResponse(status_code=404, content={"success": False, "error": "Rule not found"})
+        return FastJSONResponse(status_code=404, content={"success": False, "error": "Rule not found"})
     return {"success": True, "rule": rule}
 
 
@@ -56,15 +55,15 @@ async def api_automation_delete_rule(rule_id: str, request: Request):
 async def api_automation_update_rule_status(rule_id: str, request: Request):
     service = require_rule_service(request)
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
         body = {}
     status = str(body.get("status") or "")
     if status not in {"active", "paused", "draft"}:
-        return JSONResponse(status_code=400, content={"success": False, "error": "status must be active, paused, or draft"})
-    rule = await asyncio.get_event_loop().run_in_executor(None, service.update_rule_status, rule_id, status)
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "status must be active, paused, or draft"})
+    rule = await run_blocking(service.update_rule_status, rule_id, status)
     if not rule:
-        return JSONResponse(status_code=404, content={"success": False, "error": "Rule not found"})
+        return FastJSONResponse(status_code=404, content={"success": False, "error": "Rule not found"})
     return {"success": True, "rule": rule}
 
 
@@ -72,10 +71,10 @@ async def api_automation_update_rule_status(rule_id: str, request: Request):
 async def api_automation_evaluate(request: Request):
     service = require_rule_service(request)
     try:
-        events = await asyncio.get_event_loop().run_in_executor(None, service.evaluate_active_rules)
+        events = await run_blocking(service.evaluate_active_rules)
         return {"success": True, "events": events, "count": len(events)}
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.get("/api/automation/callbacks")
@@ -88,31 +87,31 @@ async def api_automation_callbacks(request: Request, limit: int = Query(25)):
 async def api_automation_receive_callback(request: Request):
     service = require_rule_service(request)
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
         try:
             body = dict(await request.form())
         except Exception:
-            return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+            return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
     try:
-        event = await asyncio.get_event_loop().run_in_executor(None, service.receive_callback, body)
+        event = await run_blocking(service.receive_callback, body)
         return {"success": True, "event": event}
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.post("/api/automation/callbacks/webhook")
 async def api_automation_receive_webhook(request: Request):
     service = require_rule_service(request)
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
         try:
             body = dict(await request.form())
         except Exception:
-            return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+            return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
     try:
-        event = await asyncio.get_event_loop().run_in_executor(None, service.receive_callback, body, "webhook")
+        event = await run_blocking(service.receive_callback, body, "webhook")
         return {"success": True, "event": event}
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Query, Request
-from fastapi.responses import JSONResponse
 
+from ...core.serialization import FastJSONResponse, read_json
 from ...core.state import get_backend_state, require_audit_log
 
 router = APIRouter()
 
+# Fractions of the limiter's MAX_PER_MINUTE at which the rate-limit status degrades.
+RATE_WARNING_RATIO = 0.8
+RATE_CRITICAL_RATIO = 0.95
+
 
 @router.get("/api/diagnostics/execution-validation")
 async def api_execution_validation(request: Request, limit: int = Query(10)):
@@ -22,9 +26,9 @@ async def api_execution_validation(request: Request, limit: int = Query(10)):
 async def api_checksum(request: Request):
     backend = get_backend_state(request)
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception as exc:
-        return JSONResponse(status_code=400, content={"error": str(exc)})
+        return FastJSONResponse(status_code=400, content={"error": str(exc)})
     timestamp = body.get("timestamp")
     if not timestamp:
         from datetime import datetime
@@ -48,14 +52,21 @@ async def api_rate_limits(request: Request):
     calls_last_minute = getattr(engine.rate_limiter, "calls_last_minute", 0)
     queue_depth = getattr(engine.rate_limiter, "queue_depth", 0)
     min_interval = getattr(type(engine.rate_limiter), "MIN_INTERVAL_MS", 0)
+    limit = getattr(type(engine.rate_limiter), "MAX_PER_MINUTE", 100)
     
+    if calls_last_minute < limit * RATE_WARNING_RATIO:
+        status = "healthy"
+    elif calls_last_minute < limit * RATE_CRITICAL_RATIO:
+        status = "warning"
+    else:
+        status = "critical"
     return {
         "success": True,
         "rate_limits": {
             "calls_last_minute": calls_last_minute,
-            "limit_per_minute": getattr(type(engine.rate_limiter), "MAX_CALLS_PER_MINUTE", 60), # assuming 60 or similar
+            "limit_per_minute": limit,
             "queue_depth": queue_depth,
             "min_interval_ms": min_interval,
-            "status": "healthy" if calls_last_minute < 50 else "warning" if calls_last_minute < 60 else "critical"
+            "status": status,
         }
     }
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Query, Request
-from fastapi.responses import JSONResponse
 
+from ...core.serialization import FastJSONResponse, read_json
 from ...core.state import require_layout_service
 
 router = APIRouter()
@@ -19,7 +19,7 @@ async def api_get_layout(layout_id: str, request: Request):
     service = require_layout_service(request)
     layout = service.get_layout(layout_id)
     if layout is None:
-        return JSONResponse(status_code=404, content={"success": False, "error": "Layout not found"})
+        return FastJSONResponse(status_code=404, content={"success": False, "error": "Layout not found"})
     return {"success": True, "data": layout}
 
 
@@ -27,15 +27,15 @@ async def api_get_layout(layout_id: str, request: Request):
 async def api_save_layout(layout_id: str, request: Request):
     service = require_layout_service(request)
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
 
     workspace_id = str(body.get("workspace_id") or body.get("workspaceId") or "").strip()
     name = str(body.get("name") or "").strip()
     panels = body.get("panels")
     if not workspace_id or not name or not isinstance(panels, (dict, list)):
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=400,
             content={"success": False, "error": "workspace_id, name, and panels are required"},
         )
@@ -55,5 +55,5 @@ async def api_delete_layout(layout_id: str, request: Request):
     service = require_layout_service(request)
     deleted = service.delete_layout(layout_id)
     if not deleted:
-        return JSONResponse(status_code=404, content={"success": False, "error": "Layout not found"})
+        return FastJSONResponse(status_code=404, content={"success": False, "error": "Layout not found"})
     return {"success": True}
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-import asyncio
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
 
+from ...core.executor import run_blocking
+from ...core.serialization import FastJSONResponse, etag_response, stream_json_array
 from ...core.state import get_backend_state, require_market_service
 
 router = APIRouter()
 
+CHAIN_BROWSER_MAX_AGE_S = 2
+
 
 @router.get("/api/expiries")
 async def api_expiries(
@@ -18,11 +20,11 @@ async def api_expiries(
     exchange_code: str = Query("NFO"),
 ):
     _ = exchange_code
-    return {
+    return FastJSONResponse({
         "success": True,
         "stock_code": stock_code,
         "expiries": require_market_service(request).get_expiries(stock_code, count=5),
-    }
+    })
 
 
 @router.get("/api/spot")
@@ -42,9 +44,9 @@ async def api_spot(
         return {"success": True, "spot": cached, "source": "ws_tick", "stock_code": stock_code, "exchange_code": exchange_code}
 
     try:
-        return require_market_service(request).get_spot(stock_code, exchange_code)
+        return FastJSONResponse(await require_market_service(request).get_spot_async(stock_code, exchange_code))
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.get("/api/optionchain")
@@ -55,6 +57,7 @@ async def api_optionchain(
     expiry_date: str = Query(...),
     right: Optional[str] = Query("Call"),
     strike_price: str = Query(""),
+    no_cache: bool = Query(False),
 ):
     backend = get_backend_state(request)
     engine = backend.engine
@@ -62,18 +65,20 @@ async def api_optionchain(
         raise HTTPException(status_code=401, detail="Not connected - POST /api/connect first")
 
     try:
-        data = await asyncio.get_event_loop().run_in_executor(
-            None,
-            require_market_service(request).fetch_option_chain,
+        service = require_market_service(request)
+        body = await service.option_chain_body_async(
             stock_code,
             exchange_code,
             expiry_date,
             right or "Call",
             strike_price,
+            use_cache=not no_cache,
         )
-        return {"success": True, "data": data, "count": len(data)}
+        # Several tabs poll the same expiry; a repeat of a still-cached chain costs them a 304,
+        # and a browser re-render within a couple of seconds doesn't leave the machine at all.
+        return etag_response(request, body, max_age=CHAIN_BROWSER_MAX_AGE_S)
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.get("/api/quote")
@@ -84,18 +89,19 @@ async def api_quote(
     expiry_date: str = Query(...),
     right: str = Query(...),
     strike_price: str = Query(...),
+    no_cache: bool = Query(False),
 ):
     backend = get_backend_state(request)
     engine = backend.engine
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        data = await asyncio.get_event_loop().run_in_executor(
-            None, require_market_service(request).get_quote, stock_code, exchange_code, expiry_date, right, strike_price
+        data = await require_market_service(request).get_quote_async(
+            stock_code, exchange_code, expiry_date, right, strike_price, use_cache=not no_cache
         )
-        return {"success": True, "data": data}
+        return FastJSONResponse({"success": True, "data": data})
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.get("/api/historical")
@@ -115,8 +121,7 @@ async def api_historical(
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        data = await asyncio.get_event_loop().run_in_executor(
-            None,
+        data = await run_blocking(
             require_market_service(request).get_historical,
             stock_code,
             exchange_code,
@@ -127,9 +132,11 @@ async def api_historical(
             right,
             strike_price,
         )
-        return {"success": True, "data": data}
+        if isinstance(data, list):
+            return stream_json_array(data)
+        return FastJSONResponse({"success": True, "data": data})
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.get("/api/depth")
@@ -146,8 +153,7 @@ async def api_depth(
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        data = await asyncio.get_event_loop().run_in_executor(
-            None,
+        data = await run_blocking(
             require_market_service(request).get_depth,
             stock_code,
             exchange_code,
@@ -155,6 +161,6 @@ async def api_depth(
             right,
             strike_price,
         )
-        return {"success": True, "data": data}
+        return FastJSONResponse({"success": True, "data": data})
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import asyncio
 import time
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
 
+from ...core.executor import run_blocking, run_order_blocking
+from ...core.serialization import FastJSONResponse, read_json
 from ...core.state import get_backend_state, require_order_service
 
 router = APIRouter()
@@ -18,17 +18,17 @@ async def api_preview(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
     legs = body.get("legs", [])
     if not legs:
         return {"success": True, "data": require_order_service(request).preview([])}
     try:
-        data = await asyncio.get_event_loop().run_in_executor(None, require_order_service(request).preview, legs)
+        data = await run_blocking(require_order_service(request).preview, legs)
         return {"success": True, "data": data}
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.post("/api/margin")
@@ -38,17 +38,17 @@ async def api_margin(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
     legs = body.get("legs", [])
     if not legs:
         return {"success": True, "data": require_order_service(request).margin([])}
     try:
-        data = await asyncio.get_event_loop().run_in_executor(None, require_order_service(request).margin, legs)
+        data = await run_blocking(require_order_service(request).margin, legs)
         return {"success": True, "data": data}
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.post("/api/repair-preview")
@@ -58,12 +58,11 @@ async def api_repair_preview(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
     try:
-        data = await asyncio.get_event_loop().run_in_executor(
-            None,
+        data = await run_blocking(
             require_order_service(request).repair_preview,
             body.get("current_legs", []),
             body.get("repair_legs", []),
@@ -71,7 +70,7 @@ async def api_repair_preview(request: Request):
         )
         return {"success": True, "data": data}
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.post("/api/order")
@@ -81,14 +80,14 @@ async def api_order(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
     try:
-        result = await asyncio.get_event_loop().run_in_executor(None, require_order_service(request).place_order, body)
+        result = await require_order_service(request).place_order_async(body)
         return result
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.post("/api/strategy/execute")
@@ -98,17 +97,17 @@ async def api_strategy_execute(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
     legs = body.get("legs", [])
     if not legs:
-        return JSONResponse(status_code=400, content={"success": False, "error": "No legs provided"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "No legs provided"})
     try:
-        result = await asyncio.get_event_loop().run_in_executor(None, require_order_service(request).execute_strategy, legs)
+        result = await require_order_service(request).execute_strategy_async(legs)
         return result
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.post("/api/squareoff")
@@ -118,14 +117,14 @@ async def api_squareoff(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
     try:
-        result = await asyncio.get_event_loop().run_in_executor(None, require_order_service(request).square_off, body)
+        result = await run_order_blocking(require_order_service(request).square_off, body)
         return result
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.post("/api/order/cancel")
@@ -135,23 +134,22 @@ async def api_cancel_order(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
     order_id = body.get("order_id", "")
     exchange_code = body.get("exchange_code", "NFO")
     if not order_id:
-        return JSONResponse(status_code=400, content={"success": False, "error": "order_id required"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "order_id required"})
     try:
-        result = await asyncio.get_event_loop().run_in_executor(
-            None,
+        result = await run_order_blocking(
             require_order_service(request).cancel_order,
             order_id,
             exchange_code,
         )
         return result
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.patch("/api/order/modify")
@@ -161,12 +159,11 @@ async def api_modify_order(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
     try:
-        result = await asyncio.get_event_loop().run_in_executor(
-            None,
+        result = await run_order_blocking(
             require_order_service(request).modify_order,
             body.get("order_id", ""),
             body.get("exchange_code", "NFO"),
@@ -177,4 +174,4 @@ async def api_modify_order(request: Request):
         )
         return result
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import asyncio
-
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
 
+from ...core.serialization import FastJSONResponse
 from ...core.state import get_backend_state, require_portfolio_service
 
 router = APIRouter()
@@ -17,10 +15,10 @@ async def api_order_book(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        data = await asyncio.get_event_loop().run_in_executor(None, require_portfolio_service(request).get_orders)
-        return {"success": True, "data": data}
+        data = await require_portfolio_service(request).fetch_async("orders")
+        return FastJSONResponse({"success": True, "data": data})
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.get("/api/trades")
@@ -30,10 +28,10 @@ async def api_trade_book(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        data = await asyncio.get_event_loop().run_in_executor(None, require_portfolio_service(request).get_trades)
-        return {"success": True, "data": data}
+        data = await require_portfolio_service(request).fetch_async("trades")
+        return FastJSONResponse({"success": True, "data": data})
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.get("/api/positions")
@@ -43,10 +41,10 @@ async def api_positions(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        data = await asyncio.get_event_loop().run_in_executor(None, require_portfolio_service(request).get_positions)
-        return {"success": True, "data": data}
+        data = await require_portfolio_service(request).fetch_async("positions")
+        return FastJSONResponse({"success": True, "data": data})
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.get("/api/funds")
@@ -56,7 +54,7 @@ async def api_funds(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        data = await asyncio.get_event_loop().run_in_executor(None, require_portfolio_service(request).get_funds)
-        return {"success": True, "data": data}
+        data = await require_portfolio_service(request).fetch_async("funds")
+        return FastJSONResponse({"success": True, "data": data})
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import asyncio
-
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
 
+from ...core.executor import run_blocking
+from ...core.serialization import FastJSONResponse, read_json
 from ...core.state import require_journal_service
 
 router = APIRouter()
@@ -20,11 +19,11 @@ async def api_review_state(request: Request):
 async def api_review_state_replace(request: Request):
     service = require_journal_service(request)
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
     try:
-        data = await asyncio.get_event_loop().run_in_executor(None, service.replace_state, body)
+        data = await run_blocking(service.replace_state, body)
         return {"success": True, "data": data}
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
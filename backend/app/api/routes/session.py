@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
+from ...core.executor import run_blocking
+from ...core.serialization import FastJSONResponse, read_json
 from ...core.state import get_backend_state, require_connection_service
 
 router = APIRouter()
@@ -13,9 +14,9 @@ router = APIRouter()
 
 @router.get("/")
 @router.get("/health")
-async def health(request: Request) -> dict[str, Any]:
+async def health(request: Request) -> Response:
     service = require_connection_service(request)
-    return service.health()
+    return Response(content=service.health_bytes(), media_type="application/json")
 
 
 @router.get("/ping")
@@ -29,7 +30,7 @@ async def api_connect(request: Request):
     backend = get_backend_state(request)
     engine = backend.engine
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
         body = {}
 
@@ -44,15 +45,15 @@ async def api_connect(request: Request):
     )
 
     if not all([api_key, api_secret, session_token]):
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=400,
             content={"success": False, "error": "Missing: api_key, api_secret, session_token"},
         )
 
     try:
         service = require_connection_service(request)
-        return await asyncio.get_event_loop().run_in_executor(
-            None, service.connect, api_key, api_secret, session_token
+        return await run_blocking(
+            service.connect, api_key, api_secret, session_token
         )
     except Exception as exc:
         msg = str(exc)
@@ -63,17 +64,21 @@ async def api_connect(request: Request):
             if "key" in msg.lower()
             else ""
         )
-        return JSONResponse(status_code=200, content={"success": False, "error": msg + hint})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": msg + hint})
 
 
 @router.post("/api/disconnect")
 async def api_disconnect(request: Request) -> dict[str, Any]:
     service = require_connection_service(request)
-    await asyncio.get_event_loop().run_in_executor(None, service.disconnect)
+    await run_blocking(service.disconnect)
     return {"success": True, "message": "Disconnected"}
 
 
 @router.get("/api/ratelimit")
 async def api_ratelimit(request: Request) -> dict[str, Any]:
     service = require_connection_service(request)
-    return service.ratelimit()
+    payload = service.ratelimit()
+    market_service = get_backend_state(request).market_service
+    if market_service is not None:
+        payload["cache"] = market_service.cache_stats()
+    return payload
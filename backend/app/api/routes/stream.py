@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-import time
 
-from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response
 
+from ...core.executor import run_blocking
+from ...core.serialization import FastJSONResponse, dumps_text, read_json
 from ...core.state import get_backend_state, require_stream_service
+from ...services.streaming.tick_broadcaster import FLUSH_INTERVAL_S, RESYNC
 
 router = APIRouter()
 
+LONG_POLL_MAX_S = 25.0
+
 
 @router.post("/api/ws/subscribe")
 async def api_ws_subscribe(request: Request):
@@ -18,9 +22,9 @@ async def api_ws_subscribe(request: Request):
     if not engine.connected:
         raise HTTPException(status_code=401, detail="Not connected")
     try:
-        body = await request.json()
+        body = await read_json(request)
     except Exception:
-        return JSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "Invalid JSON"})
 
     stock_code = body.get("stock_code", "NIFTY")
     exchange_code = body.get("exchange_code", "NFO")
@@ -29,11 +33,10 @@ async def api_ws_subscribe(request: Request):
     rights = body.get("rights", ["Call", "Put"])
 
     if not expiry_date or not strikes:
-        return JSONResponse(status_code=400, content={"success": False, "error": "expiry_date and strikes required"})
+        return FastJSONResponse(status_code=400, content={"success": False, "error": "expiry_date and strikes required"})
 
     try:
-        result = await asyncio.get_event_loop().run_in_executor(
-            None,
+        result = await run_blocking(
             require_stream_service(request).subscribe_option_chain,
             stock_code,
             exchange_code,
@@ -43,37 +46,114 @@ async def api_ws_subscribe(request: Request):
         )
         return {"success": True, **result}
     except Exception as exc:
-        return JSONResponse(status_code=200, content={"success": False, "error": str(exc)})
+        return FastJSONResponse(status_code=200, content={"success": False, "error": str(exc)})
 
 
 @router.websocket("/ws/ticks")
 async def ws_ticks(websocket: WebSocket):
-    backend = websocket.app.state.backend_state
-    engine = backend.engine
     await websocket.accept()
-    last_version = -1
     service = websocket.app.state.backend_state.stream_service
     if service is None:
         await websocket.close(code=1011)
         return
-    heartbeat_counter = 0
+    binary = websocket.query_params.get("format") == "binary"
+
+    def snapshot() -> list[str | bytes]:
+        if binary:
+            return service.build_binary_frames()[2]
+        return [service.tick_frame()[1]]
+
+    # Register before snapshotting so no broadcast can fall between the two.
+    frames = service.broadcaster.register(binary=binary)
     try:
+        pending = snapshot()
         while True:
-            await asyncio.sleep(0.5)
-            current_version = engine.tick_store.get_version()
-            heartbeat_counter += 1
-
-            if current_version == last_version:
-                if heartbeat_counter % 10 == 0:
-                    await websocket.send_json(service.build_heartbeat_payload())
+            for frame in pending:
+                if isinstance(frame, bytes):
+                    await websocket.send_bytes(frame)
+                else:
+                    await websocket.send_text(frame)
+            try:
+                frame = await asyncio.wait_for(frames.get(), timeout=5.0)
+            except asyncio.TimeoutError:
+                pending = [dumps_text(service.build_heartbeat_payload())]
                 continue
+            pending = snapshot() if frame is RESYNC else [frame]
+    except WebSocketDisconnect:
+        return
+    finally:
+        service.broadcaster.unregister(frames)
+
+
+@router.websocket("/ws/status")
+async def ws_status(websocket: WebSocket):
+    # Pushes the tick-store version and row count when they change, for UIs that would
+    # otherwise poll /health for them. Woken by store writes, at most once per flush interval.
+    await websocket.accept()
+    service = websocket.app.state.backend_state.stream_service
+    if service is None:
+        await websocket.close(code=1011)
+        return
+    facade = service.tick_store_facade
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+    pending = False
+
+    def notify() -> None:
+        # Feed thread; only the first write after each send crosses into the loop.
+        nonlocal pending
+        if pending:
+            return
+        pending = True
+        try:
+            loop.call_soon_threadsafe(changed.set)
+        except RuntimeError:
+            pass
 
-            last_version = current_version
-            await websocket.send_json(service.build_tick_payload())
+    facade.add_listener(notify)
+    receiver = asyncio.ensure_future(websocket.receive())
+    last_frame = None
+    try:
+        while True:
+            # Rendered once per store version and shared by every status socket.
+            _, frame = service.status_frame()
+            if frame != last_frame:
+                last_frame = frame
+                await websocket.send_text(frame)
+            waiter = asyncio.ensure_future(changed.wait())
+            await asyncio.wait({receiver, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            waiter.cancel()
+            if receiver.done():
+                if receiver.result()["type"] == "websocket.disconnect":
+                    return
+                receiver = asyncio.ensure_future(websocket.receive())
+                continue
+            changed.clear()
+            pending = False
+            await asyncio.sleep(FLUSH_INTERVAL_S)
     except WebSocketDisconnect:
         return
+    finally:
+        receiver.cancel()
+        facade.remove_listener(notify)
 
 
+# Tick payloads are plain JSON already; returning the response directly skips
+# FastAPI's jsonable_encoder walk over every row.
 @router.get("/api/ticks")
-async def api_ticks(request: Request, since_version: int = 0):
-    return require_stream_service(request).get_ticks_since(since_version)
+async def api_ticks(request: Request, since_version: int = 0, wait: float = Query(0.0, ge=0.0, le=LONG_POLL_MAX_S)):
+    # wait > 0 turns an unchanged poll into a long-poll that returns on the next store write.
+    service = require_stream_service(request)
+    await service.wait_for_version(since_version, wait)
+    return Response(
+        content=service.ticks_since_frame(since_version),
+        media_type="application/json",
+    )
+
+
+@router.get("/api/option_chain/delta")
+async def api_option_chain_delta(request: Request, since_version: int = -1):
+    return Response(
+        content=require_stream_service(request).chain_delta_frame(since_version),
+        media_type="application/json",
+    )
@@ -1,7 +1,63 @@
 from __future__ import annotations
 
+import importlib
 from typing import Any, Callable
 
+from ...core.executor import get_order_executor
+
+# Resolved on first connect rather than at import: the Kaggle entrypoint imports this
+# module before it pip-installs breeze-connect.
+_BreezeConnect: Any = None
+
+HTTP_POOL_SIZE = 4
+
+
+class _SessionRequests:
+    """Stands in for ``requests`` inside the SDK module so its module-level
+    ``requests.get/post/put/delete`` calls go through one keep-alive Session."""
+
+    _VERBS = frozenset({"get", "post", "put", "delete", "request"})
+
+    def __init__(self, session: Any, requests_module: Any):
+        self._session = session
+        self._requests = requests_module
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._VERBS:
+            return getattr(self._session, name)
+        return getattr(self._requests, name)
+
+
+def _pool_sdk_http() -> None:
+    # Without this every REST call paid a fresh TCP + TLS handshake to ICICI. Only
+    # connect failures are retried: a read retry could resend an order.
+    # urllib3 already sets TCP_NODELAY on its sockets.
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2),
+        ),
+    )
+    sdk_module = importlib.import_module("breeze_connect.breeze_connect")
+    sdk_module.requests = _SessionRequests(session, requests)
+
+
+def _breeze_connect_cls() -> Any:
+    global _BreezeConnect
+    if _BreezeConnect is None:
+        from breeze_connect import BreezeConnect
+
+        _pool_sdk_http()
+        _BreezeConnect = BreezeConnect
+    return _BreezeConnect
+
 
 class BreezeBrokerClient:
     def __init__(self, rate_limiter: Any):
@@ -17,9 +73,7 @@ class BreezeBrokerClient:
         return self.sdk
 
     def connect(self, api_key: str, api_secret: str, session_token: str):
-        from breeze_connect import BreezeConnect
-
-        sdk = BreezeConnect(api_key=api_key)
+        sdk = _breeze_connect_cls()(api_key=api_key)
         sdk.generate_session(api_secret=api_secret, session_token=session_token)
         self.sdk = sdk
         return sdk
@@ -27,18 +81,32 @@ class BreezeBrokerClient:
     def _enqueue(self, fn: Callable[[], Any]) -> Any:
         return self.rate_limiter.enqueue(fn)
 
+    async def _call(self, fn: Callable[[], Any], executor: Any = None) -> Any:
+        if executor is None:
+            return await self.rate_limiter.call(fn)
+        return await self.rate_limiter.call(fn, executor=executor)
+
     def get_customer_details(self):
         return self._enqueue(lambda: self.require_sdk().get_customer_details())
 
     def get_quotes(self, **kwargs):
         return self._enqueue(lambda: self.require_sdk().get_quotes(**kwargs))
 
+    async def get_quotes_async(self, **kwargs):
+        return await self._call(lambda: self.require_sdk().get_quotes(**kwargs))
+
     def get_option_chain_quotes(self, **kwargs):
         return self._enqueue(lambda: self.require_sdk().get_option_chain_quotes(**kwargs))
 
+    async def get_option_chain_quotes_async(self, **kwargs):
+        return await self._call(lambda: self.require_sdk().get_option_chain_quotes(**kwargs))
+
     def place_order(self, **kwargs):
         return self._enqueue(lambda: self.require_sdk().place_order(**kwargs))
 
+    async def place_order_async(self, **kwargs):
+        return await self._call(lambda: self.require_sdk().place_order(**kwargs), executor=get_order_executor())
+
     def cancel_order(self, **kwargs):
         return self._enqueue(lambda: self.require_sdk().cancel_order(**kwargs))
 
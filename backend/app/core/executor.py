@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+
+def _pool_size(name: str, default: int) -> int:
+    # A typo in the environment shouldn't stop the backend from importing.
+    try:
+        return max(1, int(os.environ.get(name, "")))
+    except ValueError:
+        return default
+
+
+# Blocking route work is almost all Breeze REST, which the rate limiter caps at one
+# call per ~600ms after a short burst; a larger pool only adds idle threads.
+BREEZE_MAX_WORKERS = _pool_size("BREEZE_POOL", 8)
+# Order SDK calls (placement through the rate limiter, square-off, cancel, modify) get
+# their own workers so book/position polling queued on the shared pool can't delay them.
+ORDER_MAX_WORKERS = _pool_size("ORDER_POOL", 4)
+
+_executor: ThreadPoolExecutor | None = None
+_order_executor: ThreadPoolExecutor | None = None
+_order_thread = threading.local()
+
+
+def _mark_order_thread() -> None:
+    _order_thread.active = True
+
+
+def in_order_executor() -> bool:
+    """True on an order-pool worker, where waiting on more order-pool work could deadlock."""
+    return getattr(_order_thread, "active", False)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=BREEZE_MAX_WORKERS, thread_name_prefix="breeze")
+    return _executor
+
+
+def get_order_executor() -> ThreadPoolExecutor:
+    global _order_executor
+    if _order_executor is None:
+        _order_executor = ThreadPoolExecutor(
+            max_workers=ORDER_MAX_WORKERS,
+            thread_name_prefix="breeze-order",
+            initializer=_mark_order_thread,
+        )
+    return _order_executor
+
+
+def shutdown_executor() -> None:
+    global _executor, _order_executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+    if _order_executor is not None:
+        _order_executor.shutdown(wait=False)
+        _order_executor = None
+
+
+async def run_blocking(fn: Callable[..., Any], *args: Any) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(get_executor(), fn, *args)
+
+
+async def run_order_blocking(fn: Callable[..., Any], *args: Any) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(get_order_executor(), fn, *args)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, AsyncIterator, Sequence
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def dumps_text(content: Any) -> str:
+    return dumps(content).decode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+async def read_json(request: Request) -> Any:
+    # Drop-in for request.json(); orjson's JSONDecodeError subclasses ValueError.
+    return loads(await request.body())
+
+
+STREAM_BATCH_ROWS = 500
+
+
+async def _json_array_chunks(head: bytes, rows: Sequence[Any], tail: bytes) -> AsyncIterator[bytes]:
+    yield head
+    for start in range(0, len(rows), STREAM_BATCH_ROWS):
+        chunk = b",".join(dumps(row) for row in rows[start:start + STREAM_BATCH_ROWS])
+        yield chunk if start == 0 else b"," + chunk
+    yield tail
+
+
+def stream_json_array(rows: Sequence[Any], key: str = "data") -> StreamingResponse:
+    """Send ``{"success": true, key: rows}`` a batch of rows at a time instead of as one buffer."""
+    head = b'{"success":true,' + dumps(key) + b":["
+    return StreamingResponse(_json_array_chunks(head, rows, b"]}"), media_type="application/json")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that renders through orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def etag_response(request: Request, body: bytes, max_age: int = 0) -> Response:
+    """Tag a rendered JSON ``body`` and answer a matching ``If-None-Match`` with a bodyless 304."""
+    headers = {"ETag": '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'}
+    if max_age:
+        headers["Cache-Control"] = f"private, max-age={max_age}"
+    if headers["ETag"] in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
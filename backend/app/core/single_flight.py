@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """Lets identical concurrent async calls share one in-flight task per key."""
+
+    def __init__(self):
+        self.inflight: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        # shield keeps a disconnecting caller from cancelling the call for everyone else.
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self.inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self.inflight.get(key) is task:
+            del self.inflight[key]
+        if not task.cancelled():
+            task.exception()
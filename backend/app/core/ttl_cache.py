@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire ``ttl`` seconds after they were stored."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING and entry[0] > now:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not _MISSING:
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_s": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
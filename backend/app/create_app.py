@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hmac
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .api.routes.automation import router as automation_router
 from .api.routes.compat import router as compat_router
@@ -14,6 +18,8 @@ from .api.routes.portfolio import router as portfolio_router
 from .api.routes.reviews import router as reviews_router
 from .api.routes.session import router as session_router
 from .api.routes.stream import router as stream_router
+from .core.executor import shutdown_executor
+from .core.serialization import FastJSONResponse
 from .core.settings import settings
 from .core.state import BackendState
 from .services.automation.rule_service import RuleService
@@ -30,11 +36,19 @@ from .storage.database import init_sqlite
 from .storage.layout_repo import LayoutRepository
 
 
+GZIP_MIN_BYTES = 1024
+
+
+def _token_matches(token: str, expected: str) -> bool:
+    # Constant-time so the shared secret guarding live orders can't be probed byte by byte.
+    return hmac.compare_digest(token.encode("utf-8"), expected.encode("utf-8"))
+
+
 def _is_authed(request: Request, backend_state: BackendState) -> bool:
     if not backend_state.auth_enabled:
         return True
-    token = request.headers.get("x-terminal-auth") or request.headers.get("X-Terminal-Auth") or ""
-    return token == backend_state.backend_auth_token
+    # Starlette headers are case-insensitive already.
+    return _token_matches(request.headers.get("x-terminal-auth", ""), backend_state.backend_auth_token)
 
 
 def _is_webhook_authed(request: Request, backend_state: BackendState) -> bool:
@@ -42,11 +56,50 @@ def _is_webhook_authed(request: Request, backend_state: BackendState) -> bool:
         return False
     token = (
         request.headers.get("x-automation-webhook-secret")
-        or request.headers.get("X-Automation-Webhook-Secret")
         or request.query_params.get("secret")
         or ""
     )
-    return token == backend_state.automation_webhook_secret
+    return _token_matches(token, backend_state.automation_webhook_secret)
+
+
+class _ApiAuthGate:
+    """Pure ASGI gate for ``/api/`` routes; health polls, static paths and websockets pass straight through."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or not path.startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        backend = scope["app"].state.backend_state
+        if path.startswith("/api/automation/callbacks/webhook"):
+            if not (_is_authed(request, backend) or _is_webhook_authed(request, backend)):
+                response = FastJSONResponse(
+                    status_code=401,
+                    content={"success": False, "error": "Unauthorized - missing automation webhook secret"},
+                )
+                await response(scope, receive, send)
+                return
+        elif not _is_authed(request, backend):
+            response = FastJSONResponse(
+                status_code=401,
+                content={"success": False, "error": "Unauthorized - missing/invalid X-Terminal-Auth"},
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    try:
+        yield
+    finally:
+        shutdown_executor()
 
 
 def create_app(
@@ -67,14 +120,15 @@ def create_app(
         state.journal_service = JournalService(state.engine.seller_reviews, audit_log=state.audit_log)
     if state.engine is not None and state.tick_store_facade is None:
         state.tick_store_facade = TickStoreFacade(state.engine.tick_store)
+    if state.engine is not None and state.market_service is None:
+        state.market_service = MarketService(state.engine)
     if state.engine is not None and state.connection_service is None:
         state.connection_service = ConnectionService(
             state.engine,
             auth_enabled=state.auth_enabled,
             version=state.version,
+            market_service=state.market_service,
         )
-    if state.engine is not None and state.market_service is None:
-        state.market_service = MarketService(state.engine)
     if state.engine is not None and state.order_service is None:
         state.order_service = OrderService(state.engine)
     if state.engine is not None and state.portfolio_service is None:
@@ -82,9 +136,14 @@ def create_app(
     if state.engine is not None and state.stream_service is None:
         state.stream_service = StreamService(state.engine, state.tick_store_facade)
 
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, default_response_class=FastJSONResponse, lifespan=_lifespan)
     app.state.backend_state = state
 
+    # Added first so CORSMiddleware wraps it and 401s still carry CORS headers.
+    app.add_middleware(_ApiAuthGate)
+    # Chains, candles and books are mostly digits and squeeze well; over the tunnel,
+    # bytes on the wire dominate. Small bodies and websockets pass through untouched.
+    app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_BYTES)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -95,37 +154,6 @@ def create_app(
         max_age=86400,
     )
 
-    @app.middleware("http")
-    async def cors_everywhere(request: Request, call_next):
-        backend = app.state.backend_state
-        if request.method == "OPTIONS":
-            return Response(
-                status_code=200,
-                headers={
-                    "Access-Control-Allow-Origin": "*",
-                    "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
-                    "Access-Control-Allow-Headers": "*",
-                    "Access-Control-Max-Age": "86400",
-                },
-            )
-
-        if request.url.path.startswith("/api/automation/callbacks/webhook"):
-            if not (_is_authed(request, backend) or _is_webhook_authed(request, backend)):
-                return JSONResponse(
-                    status_code=401,
-                    content={"success": False, "error": "Unauthorized - missing automation webhook secret"},
-                )
-        elif request.url.path.startswith("/api/") and not _is_authed(request, backend):
-            return JSONResponse(
-                status_code=401,
-                content={"success": False, "error": "Unauthorized - missing/invalid X-Terminal-Auth"},
-            )
-
-        response = await call_next(request)
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Headers"] = "*"
-        return response
-
     @app.options("/{path:path}")
     async def options_handler(path: str):
         _ = path
@@ -3,6 +3,17 @@ from __future__ import annotations
 import time
 from typing import Any, List
 
+from ..streaming.tick_store import extract_fields
+
+CHAIN_ROW_FIELDS = (
+    ("ltp", ("ltp", "last_traded_price")),
+    ("oi", ("open_interest", "open-interest")),
+    ("volume", ("total_quantity_traded", "total-quantity-traded")),
+    ("iv", ("implied_volatility", "implied-volatility")),
+    ("bid", ("best_bid_price", "best-bid-price")),
+    ("ask", ("best_offer_price", "best-offer-price")),
+)
+
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
     try:
@@ -11,56 +22,86 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
+SPOT_FIELDS = ("ltp", "last_traded_price", "close", "last_price", "LastPrice")
+
+
+def _row_spot(row: dict[str, Any]) -> float:
+    # Usable spot from the first populated field; empty/None values skip the float() attempt.
+    for field in SPOT_FIELDS:
+        value = row.get(field)
+        if value:
+            ltp = _safe_float(value)
+            if ltp > 1000:
+                return ltp
+    return 0.0
+
+
 class MarketDataService:
     def __init__(self, engine: Any):
         self.engine = engine
 
-    def fetch_option_chain(
+    def _option_chain_request(
         self,
         stock_code: str,
         exchange_code: str,
         expiry_date: str,
-        right: str = "Call",
-        strike_price: str = "",
-    ) -> List[dict[str, Any]]:
+        right: str,
+        strike_price: str,
+    ) -> dict[str, Any]:
         if not self.engine.connected:
             raise RuntimeError("Not connected")
 
         right_norm = "Call" if right.lower().startswith("c") else "Put"
         self.engine.log.info(f"[REST] get_option_chain_quotes {stock_code} {expiry_date} {right_norm}")
+        return {
+            "stock_code": stock_code,
+            "exchange_code": exchange_code,
+            "product_type": "options",
+            "expiry_date": expiry_date,
+            "right": right_norm,
+            "strike_price": strike_price,
+        }
 
-        result = self.engine.broker_client.get_option_chain_quotes(
-            stock_code=stock_code,
-            exchange_code=exchange_code,
-            product_type="options",
-            expiry_date=expiry_date,
-            right=right_norm,
-            strike_price=strike_price,
-        )
+    def _seed_option_chain(self, stock_code: str, right_norm: str, result: Any) -> List[dict[str, Any]]:
         rows = result.get("Success") if isinstance(result, dict) else []
 
         if rows:
             suffix = "CE" if right_norm == "Call" else "PE"
+            batch: dict[str, dict[str, float]] = {}
             for row in rows:
                 try:
                     strike = str(int(float(row.get("strike_price") or row.get("strike-price") or 0)))
-                    key = f"{stock_code}:{strike}:{suffix}"
-                    self.engine.tick_store.update(
-                        key,
-                        {
-                            "ltp": float(row.get("ltp") or row.get("last_traded_price") or 0),
-                            "oi": float(row.get("open_interest") or row.get("open-interest") or 0),
-                            "volume": float(row.get("total_quantity_traded") or row.get("total-quantity-traded") or 0),
-                            "iv": float(row.get("implied_volatility") or row.get("implied-volatility") or 0),
-                            "bid": float(row.get("best_bid_price") or row.get("best-bid-price") or 0),
-                            "ask": float(row.get("best_offer_price") or row.get("best-offer-price") or 0),
-                        },
-                    )
+                    batch[f"{stock_code}:{strike}:{suffix}"] = extract_fields(row, CHAIN_ROW_FIELDS)
                 except Exception as exc:
                     self.engine.log.debug(f"seed tick error: {exc}")
+            self.engine.tick_store.update_many(batch)
 
         return rows or []
 
+    def fetch_option_chain(
+        self,
+        stock_code: str,
+        exchange_code: str,
+        expiry_date: str,
+        right: str = "Call",
+        strike_price: str = "",
+    ) -> List[dict[str, Any]]:
+        request = self._option_chain_request(stock_code, exchange_code, expiry_date, right, strike_price)
+        result = self.engine.broker_client.get_option_chain_quotes(**request)
+        return self._seed_option_chain(stock_code, request["right"], result)
+
+    async def fetch_option_chain_async(
+        self,
+        stock_code: str,
+        exchange_code: str,
+        expiry_date: str,
+        right: str = "Call",
+        strike_price: str = "",
+    ) -> List[dict[str, Any]]:
+        request = self._option_chain_request(stock_code, exchange_code, expiry_date, right, strike_price)
+        result = await self.engine.broker_client.get_option_chain_quotes_async(**request)
+        return self._seed_option_chain(stock_code, request["right"], result)
+
     def get_quote(
         self,
         stock_code: str,
@@ -81,7 +122,27 @@ class MarketDataService:
             product_type="options",
         )
 
-    def get_spot(self, stock_code: str, exchange_code: str) -> dict[str, Any]:
+    async def get_quote_async(
+        self,
+        stock_code: str,
+        exchange_code: str,
+        expiry_date: str,
+        right: str,
+        strike_price: str,
+    ) -> dict[str, Any]:
+        if not self.engine.connected:
+            raise RuntimeError("Not connected")
+
+        return await self.engine.broker_client.get_quotes_async(
+            stock_code=stock_code,
+            exchange_code=exchange_code,
+            expiry_date=expiry_date,
+            right=right,
+            strike_price=strike_price,
+            product_type="options",
+        )
+
+    def _spot_from_ticks(self, stock_code: str, exchange_code: str) -> dict[str, Any] | None:
         spot_prices = self.engine.tick_store.get_spot_prices()
         cached = spot_prices.get(stock_code.upper())
         if cached and cached > 1000:
@@ -92,6 +153,35 @@ class MarketDataService:
                 "stock_code": stock_code,
                 "exchange_code": exchange_code,
             }
+        return None
+
+    def _spot_from_quote(self, stock_code: str, exchange_code: str, result: Any) -> dict[str, Any]:
+        rows = result.get("Success", []) if isinstance(result, dict) else []
+        if isinstance(rows, dict):
+            rows = [rows]
+        for row in rows:
+            ltp = _row_spot(row)
+            if ltp:
+                self.engine.tick_store.update(
+                    f"{stock_code.upper()}:SPOT",
+                    {"ltp": ltp, "is_spot": True, "source": "rest"},
+                )
+                return {
+                    "success": True,
+                    "spot": ltp,
+                    "source": "rest_quote",
+                    "stock_code": stock_code,
+                    "exchange_code": exchange_code,
+                }
+        return {
+            "success": False,
+            "error": f"No spot price returned for {stock_code}/{exchange_code}. Raw Breeze response: {str(result)[:200]}",
+        }
+
+    def get_spot(self, stock_code: str, exchange_code: str) -> dict[str, Any]:
+        cached = self._spot_from_ticks(stock_code, exchange_code)
+        if cached is not None:
+            return cached
 
         try:
             result = self.engine.broker_client.get_quotes(
@@ -103,29 +193,24 @@ class MarketDataService:
             )
         except Exception as exc:
             return {"success": False, "error": str(exc)}
+        return self._spot_from_quote(stock_code, exchange_code, result)
 
-        rows = result.get("Success", []) if isinstance(result, dict) else []
-        if isinstance(rows, dict):
-            rows = [rows]
-        for row in rows:
-            for field in ("ltp", "last_traded_price", "close", "last_price", "LastPrice"):
-                ltp = _safe_float(row.get(field))
-                if ltp > 1000:
-                    self.engine.tick_store.update(
-                        f"{stock_code.upper()}:SPOT",
-                        {"ltp": ltp, "is_spot": True, "source": "rest"},
-                    )
-                    return {
-                        "success": True,
-                        "spot": ltp,
-                        "source": "rest_quote",
-                        "stock_code": stock_code,
-                        "exchange_code": exchange_code,
-                    }
-        return {
-            "success": False,
-            "error": f"No spot price returned for {stock_code}/{exchange_code}. Raw Breeze response: {str(result)[:200]}",
-        }
+    async def get_spot_async(self, stock_code: str, exchange_code: str) -> dict[str, Any]:
+        cached = self._spot_from_ticks(stock_code, exchange_code)
+        if cached is not None:
+            return cached
+
+        try:
+            result = await self.engine.broker_client.get_quotes_async(
+                stock_code=stock_code,
+                exchange_code=exchange_code,
+                expiry_date="",
+                right="",
+                strike_price="",
+            )
+        except Exception as exc:
+            return {"success": False, "error": str(exc)}
+        return self._spot_from_quote(stock_code, exchange_code, result)
 
     def get_historical(
         self,
@@ -2,11 +2,36 @@ from __future__ import annotations
 
 from typing import Any
 
+from ...core.serialization import dumps
+from ...core.single_flight import SingleFlight
+from ...core.ttl_cache import TTLCache
+
+CHAIN_CACHE_SIZE = 256
+CHAIN_CACHE_TTL_S = 60.0
+QUOTE_CACHE_SIZE = 1024
+QUOTE_CACHE_TTL_S = 5.0
+
+
+def _cache_key(stock_code: str, exchange_code: str, expiry_date: str, right: str, strike_price: str) -> tuple:
+    right_norm = "Call" if str(right).lower().startswith("c") else "Put"
+    return (stock_code.upper(), exchange_code.upper(), expiry_date, right_norm, str(strike_price))
+
 
 class MarketService:
     def __init__(self, engine: Any):
         self.engine = engine
         self.market_data = getattr(engine, "market_data_service", None)
+        self.chain_cache = TTLCache(CHAIN_CACHE_SIZE, CHAIN_CACHE_TTL_S)
+        self.quote_cache = TTLCache(QUOTE_CACHE_SIZE, QUOTE_CACHE_TTL_S)
+        self._flights = SingleFlight()
+
+    def clear_caches(self) -> None:
+        # Cached chains and quotes belong to the session that fetched them.
+        self.chain_cache.clear()
+        self.quote_cache.clear()
+
+    def cache_stats(self) -> dict[str, Any]:
+        return {"option_chain": self.chain_cache.stats(), "quote": self.quote_cache.stats()}
 
     def get_expiries(self, stock_code: str, count: int = 5) -> list[str]:
         return self.engine.__class__.get_weekly_expiries(stock_code, count=count)
@@ -16,6 +41,14 @@ class MarketService:
             return self.market_data.get_spot(stock_code, exchange_code)
         return {"success": False, "error": "Market data service is not configured"}
 
+    async def get_spot_async(self, stock_code: str, exchange_code: str) -> dict[str, Any]:
+        if self.market_data is None:
+            return {"success": False, "error": "Market data service is not configured"}
+        return await self._flights.do(
+            ("spot", stock_code.upper(), exchange_code.upper()),
+            lambda: self.market_data.get_spot_async(stock_code, exchange_code),
+        )
+
     def fetch_option_chain(
         self,
         stock_code: str,
@@ -23,15 +56,97 @@ class MarketService:
         expiry_date: str,
         right: str,
         strike_price: str,
+        use_cache: bool = True,
     ):
-        if self.market_data is not None:
-            return self.market_data.fetch_option_chain(stock_code, exchange_code, expiry_date, right, strike_price)
-        raise RuntimeError("Market data service is not configured")
+        if self.market_data is None:
+            raise RuntimeError("Market data service is not configured")
+        key = _cache_key(stock_code, exchange_code, expiry_date, right, strike_price)
+        cached = self.chain_cache.get(key) if use_cache else None
+        if cached is not None:
+            return cached[0]
+        data = self.market_data.fetch_option_chain(stock_code, exchange_code, expiry_date, right, strike_price)
+        if data:
+            self.chain_cache.set(key, [data, None])
+        return data
 
-    def get_quote(self, *args):
-        if self.market_data is not None:
-            return self.market_data.get_quote(*args)
-        raise RuntimeError("Market data service is not configured")
+    async def _chain_entry_async(self, key: tuple, args: tuple, use_cache: bool) -> list:
+        # Cache entries are [rows, rendered body or None]; the body is filled on first render.
+        if self.market_data is None:
+            raise RuntimeError("Market data service is not configured")
+        cached = self.chain_cache.get(key) if use_cache else None
+        if cached is not None:
+            return cached
+
+        async def fetch():
+            data = await self.market_data.fetch_option_chain_async(*args)
+            entry = [data, None]
+            if data:
+                self.chain_cache.set(key, entry)
+            return entry
+
+        return await self._flights.do(("chain", *key), fetch)
+
+    async def fetch_option_chain_async(
+        self,
+        stock_code: str,
+        exchange_code: str,
+        expiry_date: str,
+        right: str,
+        strike_price: str,
+        use_cache: bool = True,
+    ):
+        args = (stock_code, exchange_code, expiry_date, right, strike_price)
+        return (await self._chain_entry_async(_cache_key(*args), args, use_cache))[0]
+
+    async def option_chain_body_async(
+        self,
+        stock_code: str,
+        exchange_code: str,
+        expiry_date: str,
+        right: str,
+        strike_price: str,
+        use_cache: bool = True,
+    ) -> bytes:
+        """Serialized ``/api/optionchain`` body, rendered once per cached chain rather than per request."""
+        args = (stock_code, exchange_code, expiry_date, right, strike_price)
+        entry = await self._chain_entry_async(_cache_key(*args), args, use_cache)
+        if not use_cache:
+            return self.render_chain(entry[0])
+        if entry[1] is None:
+            entry[1] = self.render_chain(entry[0])
+        return entry[1]
+
+    @staticmethod
+    def render_chain(data: Any) -> bytes:
+        return dumps({"success": True, "data": data, "count": len(data)})
+
+    def get_quote(self, *args, use_cache: bool = True):
+        if self.market_data is None:
+            raise RuntimeError("Market data service is not configured")
+        key = _cache_key(*args)
+        cached = self.quote_cache.get(key) if use_cache else None
+        if cached is not None:
+            return cached
+        data = self.market_data.get_quote(*args)
+        if isinstance(data, dict) and data.get("Success"):
+            self.quote_cache.set(key, data)
+        return data
+
+    async def get_quote_async(self, *args, use_cache: bool = True):
+        if self.market_data is None:
+            raise RuntimeError("Market data service is not configured")
+        key = _cache_key(*args)
+        cached = self.quote_cache.get(key) if use_cache else None
+        if cached is not None:
+            return cached
+
+        async def fetch():
+            data = await self.market_data.get_quote_async(*args)
+            if isinstance(data, dict) and data.get("Success"):
+                self.quote_cache.set(key, data)
+            return data
+
+        return await self._flights.do(("quote", *key), fetch)
 
     def get_historical(self, *args):
         if self.market_data is not None:
@@ -1,4 +1,5 @@
 from .execution_workflow import ExecutionWorkflow
+from .order_result import OrderResult
 from .order_service import OrderService
 
-__all__ = ["ExecutionWorkflow", "OrderService"]
+__all__ = ["ExecutionWorkflow", "OrderResult", "OrderService"]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import threading
+import asyncio
 import time
 from typing import Any, Dict, List, Optional
 
+from ...core.executor import get_order_executor, in_order_executor, run_order_blocking
+from .order_result import OrderResult
+
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
     try:
@@ -441,41 +444,51 @@ class ExecutionWorkflow:
             "updated_at": time.time(),
         }
 
-    def place_strategy_order(self, legs: List[dict[str, Any]]) -> List[dict[str, Any]]:
+    @staticmethod
+    def _leg_result(raw: Any, idx: int) -> dict[str, Any]:
+        result = OrderResult.from_breeze(raw)
+        return {
+            "leg_index": idx,
+            "success": result.ok,
+            "order_id": result.order_id,
+            "error": result.error,
+            "raw": raw,
+        }
+
+    def _place_leg(self, leg: dict[str, Any], idx: int) -> dict[str, Any]:
+        try:
+            return self._leg_result(self.engine.place_order(leg), idx)
+        except Exception as exc:
+            return {"leg_index": idx, "success": False, "error": str(exc)}
+
+    async def _place_leg_async(self, leg: dict[str, Any], idx: int) -> dict[str, Any]:
+        try:
+            place_async = getattr(self.engine, "place_order_async", None)
+            if place_async is not None:
+                raw = await place_async(leg)
+            else:
+                raw = await run_order_blocking(self.engine.place_order, leg)
+            return self._leg_result(raw, idx)
+        except Exception as exc:
+            return {"leg_index": idx, "success": False, "error": str(exc)}
+
+    async def place_strategy_order_async(self, legs: List[dict[str, Any]]) -> List[dict[str, Any]]:
         if not self.engine.connected:
             raise RuntimeError("Not connected")
+        # Legs queue on the shared rate limiter concurrently; gather keeps leg order.
+        return list(await asyncio.gather(*(self._place_leg_async(leg, idx) for idx, leg in enumerate(legs))))
 
-        results: List[dict[str, Any]] = []
-        threads: List[threading.Thread] = []
-        results_lock = threading.Lock()
-
-        def place_one(leg: dict[str, Any], idx: int) -> None:
-            try:
-                result = self.engine.place_order(leg)
-                ok = isinstance(result, dict) and result.get("Status") == 200
-                order_id = (result.get("Success") or {}).get("order_id", "") if ok else ""
-                with results_lock:
-                    results.append({
-                        "leg_index": idx,
-                        "success": ok,
-                        "order_id": order_id,
-                        "error": result.get("Error", "") if not ok else "",
-                        "raw": result,
-                    })
-            except Exception as exc:
-                with results_lock:
-                    results.append({"leg_index": idx, "success": False, "error": str(exc)})
-
-        for idx, leg in enumerate(legs):
-            thread = threading.Thread(target=place_one, args=(leg, idx), daemon=True)
-            threads.append(thread)
-            thread.start()
-
-        for thread in threads:
-            thread.join(timeout=60)
-
-        results.sort(key=lambda item: item["leg_index"])
-        return results
+    def place_strategy_order(self, legs: List[dict[str, Any]]) -> List[dict[str, Any]]:
+        # Sync entrypoint for worker threads and the automation loop: no event loop, so it
+        # is safe from any thread. Legs go out concurrently on the order executor, unless
+        # we are already on one of its workers and waiting on it could deadlock.
+        if not self.engine.connected:
+            raise RuntimeError("Not connected")
+        if in_order_executor():
+            return [self._place_leg(leg, idx) for idx, leg in enumerate(legs)]
+        pool = get_order_executor()
+        futures = [pool.submit(self._place_leg, leg, idx) for idx, leg in enumerate(legs)]
+        return [future.result() for future in futures]
 
     def square_off_position(self, leg: dict[str, Any]) -> dict[str, Any]:
         original = (leg.get("action") or "buy").lower()
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class OrderResult:
+    ok: bool
+    order_id: str = ""
+    error: str = ""
+
+    @classmethod
+    def from_breeze(cls, result: Any) -> OrderResult:
+        """Normalize a Breeze order/cancel/modify response (``Status``/``Success``/``Error``)."""
+        if not isinstance(result, dict):
+            return cls(False, error=f"Unexpected broker response: {str(result)[:200]}")
+        if result.get("Status") == 200:
+            success = result.get("Success")
+            return cls(True, order_id=success.get("order_id", "") if isinstance(success, dict) else "")
+        return cls(False, error=result.get("Error") or "")
@@ -3,6 +3,9 @@ from __future__ import annotations
 import time
 from typing import Any
 
+from ...core.executor import run_order_blocking
+from .order_result import OrderResult
+
 
 class OrderService:
     def __init__(self, engine: Any):
@@ -43,7 +46,15 @@ class OrderService:
     def place_order(self, payload):
         if self.workflow is None:
             raise RuntimeError("Execution workflow is not configured")
-        results = self.workflow.place_strategy_order([payload])
+        return self._single_order_result(self.workflow.place_strategy_order([payload]))
+
+    async def place_order_async(self, payload):
+        if self.workflow is None:
+            raise RuntimeError("Execution workflow is not configured")
+        return self._single_order_result(await self.workflow.place_strategy_order_async([payload]))
+
+    @staticmethod
+    def _single_order_result(results):
         result = results[0] if results else {"success": False, "error": "No execution result returned"}
         return {"success": result["success"], "order_id": result.get("order_id", ""), "error": result.get("error", "")}
 
@@ -55,37 +66,47 @@ class OrderService:
 
         # If strategy was placed successfully, group it in the DB
         if success and legs:
-            import json
-            import uuid
-            group_id = f"sg_{uuid.uuid4().hex[:8]}"
-            symbol = legs[0].get("stock_code", "UNKNOWN")
-
-            try:
-                self.engine.db.execute(
-                    """
-                    INSERT INTO strategy_groups (group_id, symbol, status, legs_json, created_at, updated_at)
-                    VALUES (?, ?, 'open', ?, strftime('%s', 'now'), strftime('%s', 'now'))
-                    """,
-                    (group_id, symbol, json.dumps(legs))
-                )
-                self.engine.db.commit()
-            except Exception as e:
-                self.engine.log.error(f"Failed to save strategy group: {e}")
+            self._save_strategy_group(legs)
+        return {"success": success, "results": results}
 
+    async def execute_strategy_async(self, legs):
+        if self.workflow is None:
+            raise RuntimeError("Execution workflow is not configured")
+        # Legs go out concurrently on the request's own loop; only the sqlite write
+        # needs a worker thread.
+        results = await self.workflow.place_strategy_order_async(legs)
+        success = all(result["success"] for result in results)
+        if success and legs:
+            await run_order_blocking(self._save_strategy_group, legs)
         return {"success": success, "results": results}
 
+    def _save_strategy_group(self, legs):
+        import json
+        import uuid
+        group_id = f"sg_{uuid.uuid4().hex[:8]}"
+        symbol = legs[0].get("stock_code", "UNKNOWN")
+
+        try:
+            self.engine.db.execute(
+                """
+                INSERT INTO strategy_groups (group_id, symbol, status, legs_json, created_at, updated_at)
+                VALUES (?, ?, 'open', ?, strftime('%s', 'now'), strftime('%s', 'now'))
+                """,
+                (group_id, symbol, json.dumps(legs))
+            )
+            self.engine.db.commit()
+        except Exception as e:
+            self.engine.log.error(f"Failed to save strategy group: {e}")
+
     def square_off(self, payload):
         if self.workflow is None:
             raise RuntimeError("Execution workflow is not configured")
-        result = self.workflow.square_off_position(payload)
-        ok = isinstance(result, dict) and result.get("Status") == 200
-        order_id = (result.get("Success") or {}).get("order_id", "") if ok else ""
-        return {"success": ok, "order_id": order_id, "error": result.get("Error", "") if not ok else ""}
+        result = OrderResult.from_breeze(self.workflow.square_off_position(payload))
+        return {"success": result.ok, "order_id": result.order_id, "error": result.error}
 
     def cancel_order(self, order_id: str, exchange_code: str):
-        result = self.engine.cancel_order(order_id, exchange_code)
-        ok = isinstance(result, dict) and result.get("Status") == 200
-        return {"success": ok, "error": result.get("Error", "") if not ok else ""}
+        result = OrderResult.from_breeze(self.engine.cancel_order(order_id, exchange_code))
+        return {"success": result.ok, "error": result.error}
 
     def modify_order(
         self,
@@ -96,6 +117,7 @@ class OrderService:
         stoploss: str,
         validity: str,
     ):
-        result = self.engine.modify_order(order_id, exchange_code, quantity, price, stoploss, validity)
-        ok = isinstance(result, dict) and result.get("Status") == 200
-        return {"success": ok, "error": result.get("Error", "") if not ok else ""}
+        result = OrderResult.from_breeze(
+            self.engine.modify_order(order_id, exchange_code, quantity, price, stoploss, validity)
+        )
+        return {"success": result.ok, "error": result.error}
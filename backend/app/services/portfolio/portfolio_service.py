@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from typing import Any
+
+from ...core.executor import run_blocking
+from ...core.single_flight import SingleFlight
 from .position_grouper import PositionGrouper
 
 
@@ -8,6 +11,7 @@ class PortfolioService:
     def __init__(self, engine: Any):
         self.engine = engine
         self.position_grouper = PositionGrouper(engine)
+        self._flights = SingleFlight()
 
     def get_orders(self):
         data = self.engine.get_order_book()
@@ -30,3 +34,7 @@ class PortfolioService:
 
     def get_funds(self):
         return self.engine.get_funds()
+
+    async def fetch_async(self, name: str) -> Any:
+        """Run ``get_<name>`` on the shared executor; tabs polling the same book share one call."""
+        return await self._flights.do(name, lambda: run_blocking(getattr(self, f"get_{name}")))
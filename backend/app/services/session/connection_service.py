@@ -1,42 +1,75 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime
 from typing import Any
 
+from ...core.serialization import dumps
+
+HEALTH_CACHE_TTL_S = 0.2
+
 
 class ConnectionService:
-    def __init__(self, engine: Any, *, auth_enabled: bool = False, version: str = "7.0"):
+    def __init__(self, engine: Any, *, auth_enabled: bool = False, version: str = "7.0", market_service: Any = None):
         self.engine = engine
+        self.market_service = market_service
         self.auth_enabled = auth_enabled
         self.version = version
+        self._health_cache: tuple[float, dict[str, Any]] | None = None
+        self._health_body: tuple[dict[str, Any], bytes] | None = None
 
     def health(self) -> dict[str, Any]:
-        return {
+        # Polled by every open tab and the tunnel keepalive; serve bursts from a short-lived snapshot.
+        now = time.monotonic()
+        cached = self._health_cache
+        if cached is not None and now - cached[0] < HEALTH_CACHE_TTL_S:
+            return cached[1]
+        payload = {
             "status": "online",
             "connected": self.engine.connected,
             "ws_running": self.engine.ws_running,
             "subscriptions": len(self.engine.subscribed),
-            "tick_count": len(self.engine.tick_store.get_all()["ticks"]),
+            "tick_count": self.engine.tick_store.count,
             "rest_calls_min": self.engine.rate_limiter.calls_last_minute,
             "queue_depth": self.engine.rate_limiter.queue_depth,
             "auth_enabled": self.auth_enabled,
             "version": self.version,
             "timestamp": datetime.utcnow().isoformat() + "Z",
         }
+        self._health_cache = (now, payload)
+        return payload
+
+    def health_bytes(self) -> bytes:
+        # Render each cached snapshot once rather than once per poll.
+        payload = self.health()
+        body = self._health_body
+        if body is not None and body[0] is payload:
+            return body[1]
+        rendered = dumps(payload)
+        self._health_body = (payload, rendered)
+        return rendered
 
     def ping(self) -> dict[str, str]:
         return {"status": "online", "version": self.version, "ts": datetime.utcnow().isoformat() + "Z"}
 
+    def _reset_caches(self) -> None:
+        self._health_cache = None
+        if self.market_service is not None:
+            self.market_service.clear_caches()
+
     def connect(self, api_key: str, api_secret: str, session_token: str):
+        self._reset_caches()
         return self.engine.connect(api_key, api_secret, session_token)
 
     def disconnect(self) -> None:
+        self._reset_caches()
         self.engine.disconnect()
 
     def ratelimit(self) -> dict[str, Any]:
         return {
             "calls_last_minute": self.engine.rate_limiter.calls_last_minute,
-            "max_per_minute": 100,
+            "max_per_minute": getattr(type(self.engine.rate_limiter), "MAX_PER_MINUTE", 100),
+            "burst": getattr(type(self.engine.rate_limiter), "BURST", 1),
             "min_interval_ms": getattr(type(self.engine.rate_limiter), "MIN_INTERVAL_MS", 0),
             "queue_depth": self.engine.rate_limiter.queue_depth,
         }
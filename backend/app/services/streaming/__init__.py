@@ -2,6 +2,7 @@
 
 from .realtime_manager import RealtimeManager
 from .stream_service import StreamService
+from .tick_broadcaster import TickBroadcaster
 from .tick_store import TickStoreFacade
 
-__all__ = ["RealtimeManager", "StreamService", "TickStoreFacade"]
+__all__ = ["RealtimeManager", "StreamService", "TickBroadcaster", "TickStoreFacade"]
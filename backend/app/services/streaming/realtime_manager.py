@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+import logging
+import sys
 import threading
 import time
 from typing import Any, Iterable
 
+from .tick_store import extract_fields
+
+WS_TICK_FIELDS = (
+    ("ltp", ("last_traded_price", "ltp")),
+    ("oi", ("open_interest", "oi")),
+    ("volume", ("total_quantity_traded", "volume")),
+    ("iv", ("implied_volatility", "iv")),
+    ("bid", ("best_bid_price", "bid_price")),
+    ("ask", ("best_offer_price", "ask_price")),
+    ("change_pct", ("change_percent", "change_pct")),
+)
+
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
     try:
@@ -15,11 +29,21 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
 class RealtimeManager:
     def __init__(self, engine: Any):
         self.engine = engine
+        # (stock, raw strike, right) -> interned tick-store key; bounded by the subscribed chain.
+        self._key_cache: dict[tuple[str, Any, str], str] = {}
+        # Set by the WS thread once ws_connect() has either succeeded or failed.
+        self._ws_settled = threading.Event()
 
     def on_ticks(self, ticks: dict[str, Any] | Iterable[dict[str, Any]] | None) -> None:
         if not ticks:
             return
         rows = [ticks] if isinstance(ticks, dict) else list(ticks)
+        # One clock read and one level check per batch rather than per tick.
+        now = time.time()
+        debug = self.engine.log.isEnabledFor(logging.DEBUG)
+        # Keyed by tick key, so a strike that ticks twice in one callback is written once
+        # with its latest values.
+        batch: dict[str, dict[str, Any]] = {}
         for tick in rows:
             try:
                 stock = (tick.get("stock_code") or tick.get("symbol") or "").upper()
@@ -28,21 +52,14 @@ class RealtimeManager:
                 right = "CE" if right_raw.startswith("C") else "PE"
                 if not stock:
                     continue
-                key = f"{stock}:{strike}:{right}"
-                self.engine.tick_store.update(
-                    key,
-                    {
-                        "ltp": float(tick.get("last_traded_price") or tick.get("ltp") or 0),
-                        "oi": float(tick.get("open_interest") or tick.get("oi") or 0),
-                        "volume": float(tick.get("total_quantity_traded") or tick.get("volume") or 0),
-                        "iv": float(tick.get("implied_volatility") or tick.get("iv") or 0),
-                        "bid": float(tick.get("best_bid_price") or tick.get("bid_price") or 0),
-                        "ask": float(tick.get("best_offer_price") or tick.get("ask_price") or 0),
-                        "change_pct": float(tick.get("change_percent") or tick.get("change_pct") or 0),
-                        "feed_time": str(tick.get("exchange_feed_time") or ""),
-                    },
-                )
-                self.engine.log.debug(f"[WS tick] {key} ltp={tick.get('last_traded_price', 0)}")
+                key = self._key_cache.get((stock, strike, right))
+                if key is None:
+                    key = self._key_cache[(stock, strike, right)] = sys.intern(f"{stock}:{strike}:{right}")
+                fields: dict[str, Any] = extract_fields(tick, WS_TICK_FIELDS)
+                fields["feed_time"] = str(tick.get("exchange_feed_time") or "")
+                batch[key] = fields
+                if debug:
+                    self.engine.log.debug(f"[WS tick] {key} ltp={tick.get('last_traded_price', 0)}")
 
                 underlying = 0.0
                 for field in (
@@ -59,22 +76,25 @@ class RealtimeManager:
                         if underlying > 0:
                             break
                 if underlying > 1000:
-                    self.engine.tick_store.update(
-                        f"{stock}:SPOT",
-                        {
-                            "ltp": underlying,
-                            "is_spot": True,
-                            "source": "ws_tick",
-                        },
-                    )
+                    spot_key = self._key_cache.get((stock, None, "SPOT"))
+                    if spot_key is None:
+                        spot_key = self._key_cache[(stock, None, "SPOT")] = sys.intern(f"{stock}:SPOT")
+                    batch[spot_key] = {
+                        "ltp": underlying,
+                        "is_spot": True,
+                        "source": "ws_tick",
+                    }
                     self.engine.candle_store.update(
                         stock,
                         underlying,
                         _safe_float(tick.get("total_quantity_traded") or tick.get("volume")),
+                        ts=now,
                     )
-                    self.engine.log.debug(f"[WS spot] {stock} underlying={underlying}")
+                    if debug:
+                        self.engine.log.debug(f"[WS spot] {stock} underlying={underlying}")
             except Exception as exc:
                 self.engine.log.warning(f"[WS] parse error: {exc}")
+        self.engine.tick_store.update_many(batch, ts=now)
 
     def start_websocket(self) -> None:
         if not self.engine.connected:
@@ -93,12 +113,14 @@ class RealtimeManager:
                 except Exception as exc:
                     self.engine.log.error(f"[WS] ws_connect() failed: {exc}")
                     self.engine.ws_running = False
+                finally:
+                    self._ws_settled.set()
 
+            self._ws_settled.clear()
             self.engine._ws_thread = threading.Thread(target=_run, daemon=True, name="BreezeWS")
             self.engine._ws_thread.start()
-            deadline = time.time() + 15
-            while not self.engine.ws_running and time.time() < deadline:
-                time.sleep(0.5)
+            if not self._ws_settled.wait(timeout=15):
+                self.engine.log.error("[WS] ws_connect() did not finish within 15s")
 
     def stop_websocket(self) -> None:
         if self.engine.broker_client and self.engine.ws_running:
@@ -120,7 +142,6 @@ class RealtimeManager:
         rights = rights or ["Call", "Put"]
         if not self.engine.ws_running:
             self.start_websocket()
-            time.sleep(2)
 
         # 1. Compute desired subscriptions
         desired_subs: set[str] = set()
@@ -175,7 +196,6 @@ class RealtimeManager:
                     )
                     self.engine.subscribed.add(sub_key)
                     count += 1
-                    time.sleep(0.05)
             except Exception as exc:
                 errors.append(f"{sub_key}: {exc}")
 
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import Any
+from typing import Any, Callable
+
+from ...core.serialization import dumps_text
+from .tick_broadcaster import TickBroadcaster
+
+FRAME_CACHE_SIZE = 16
 
 
 class StreamService:
@@ -9,6 +15,10 @@ class StreamService:
         self.engine = engine
         self.tick_store_facade = tick_store_facade
         self.realtime = getattr(engine, "realtime_manager", None)
+        self.broadcaster = TickBroadcaster(self)
+        # (kind, since_version, store version, ws_live) -> (payload version, serialized frame).
+        # Store versions never repeat, not even across TickStore.clear(), so a key can't go stale.
+        self._frame_cache: dict[tuple[str, int, int, bool], tuple[int, str]] = {}
 
     def subscribe_option_chain(
         self,
@@ -20,7 +30,8 @@ class StreamService:
     ):
         if self.realtime is None:
             raise RuntimeError("Realtime manager is not configured")
-        self.realtime.unsubscribe_all()
+        # The manager diffs against engine.subscribed, so strikes kept across a
+        # re-subscribe stay live instead of dropping out and back in.
         return self.realtime.subscribe_option_chain(stock_code, exchange_code, expiry_date, strikes, rights)
 
     def build_heartbeat_payload(self):
@@ -31,25 +42,103 @@ class StreamService:
             "candle_streams": self.engine.candle_store.to_stream_payload(limit=2),
         }
 
-    def build_tick_payload(self):
+    def build_tick_payload(self, since_version: int = -1):
+        version, ticks = self.tick_store_facade.get_delta(since_version)
         return {
             "type": "tick_update",
-            "version": self.tick_store_facade.get_all()["version"],
-            "ticks": self.tick_store_facade.to_option_chain_delta(),
+            "version": version,
+            "ticks": ticks,
             "spot_prices": self.tick_store_facade.get_spot_prices(),
             "candle_streams": self.engine.candle_store.to_stream_payload(limit=2),
             "ts": time.time(),
             "ws_live": self.engine.ws_running,
         }
 
+    def build_binary_frames(self, since_version: int = -1, since_row: int = 0):
+        """Return (version, next_row, [meta text frame, packed rows]) for binary /ws/ticks clients."""
+        version, packed = self.tick_store_facade.pack_delta(since_version)
+        next_row, keys = self.tick_store_facade.key_table(since_row)
+        meta = {
+            "type": "tick_meta",
+            "version": version,
+            "keys": keys,
+            "spot_prices": self.tick_store_facade.get_spot_prices(),
+            "candle_streams": self.engine.candle_store.to_stream_payload(limit=2),
+            "ts": time.time(),
+            "ws_live": self.engine.ws_running,
+        }
+        return version, next_row, [dumps_text(meta), packed]
+
+    def _cached_frame(self, kind: str, since_version: int, build: Callable[[int], dict[str, Any]]) -> tuple[int, str]:
+        key = (kind, since_version, self.tick_store_facade.get_version(), bool(self.engine.ws_running))
+        frame = self._frame_cache.get(key)
+        if frame is None:
+            payload = build(since_version)
+            frame = (payload["version"], dumps_text(payload))
+            if len(self._frame_cache) >= FRAME_CACHE_SIZE:
+                self._frame_cache.clear()
+            self._frame_cache[key] = frame
+        return frame
+
+    def tick_frame(self, since_version: int = -1) -> tuple[int, str]:
+        return self._cached_frame("tick_update", since_version, self.build_tick_payload)
+
+    def status_frame(self) -> tuple[int, str]:
+        return self._cached_frame("status", -1, self.build_status_payload)
+
+    def build_status_payload(self, since_version: int = -1):
+        _ = since_version
+        return {
+            "type": "status",
+            "version": self.tick_store_facade.get_version(),
+            "count": self.tick_store_facade.count,
+            "ws_live": self.engine.ws_running,
+        }
+
+    def chain_delta_frame(self, since_version: int) -> str:
+        return self._cached_frame("chain_delta", since_version, self.build_chain_delta_payload)[1]
+
+    def build_chain_delta_payload(self, since_version: int = -1):
+        version, rows = self.tick_store_facade.get_delta(since_version)
+        return {"success": True, "version": version, "data": rows, "count": len(rows)}
+
+    def ticks_since_frame(self, since_version: int) -> str:
+        return self._cached_frame("ticks_since", since_version, self.get_ticks_since)[1]
+
+    async def wait_for_version(self, since_version: int, timeout: float) -> None:
+        """Return once the store moves past ``since_version``, or after ``timeout`` seconds."""
+        facade = self.tick_store_facade
+        if timeout <= 0 or facade.get_version() > since_version:
+            return
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+
+        def notify() -> None:
+            # Feed thread; every write after the first is a cheap no-op.
+            if not changed.is_set():
+                try:
+                    loop.call_soon_threadsafe(changed.set)
+                except RuntimeError:
+                    pass
+
+        facade.add_listener(notify)
+        try:
+            # Re-check after registering so a write between the two can't be missed.
+            if facade.get_version() <= since_version:
+                await asyncio.wait_for(changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            facade.remove_listener(notify)
+
     def get_ticks_since(self, since_version: int):
-        data = self.tick_store_facade.get_all()
-        if data["version"] <= since_version:
-            return {"changed": False, "version": data["version"]}
+        version, ticks = self.tick_store_facade.get_delta(since_version)
+        if version <= since_version:
+            return {"changed": False, "version": version}
         return {
             "changed": True,
-            "version": data["version"],
-            "ticks": self.tick_store_facade.to_option_chain_delta(),
+            "version": version,
+            "ticks": ticks,
             "spot_prices": self.tick_store_facade.get_spot_prices(),
             "candle_streams": self.engine.candle_store.to_stream_payload(limit=2),
             "ws_live": self.engine.ws_running,
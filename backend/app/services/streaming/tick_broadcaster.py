@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+FLUSH_INTERVAL_S = 0.05
+CLIENT_QUEUE_SIZE = 32
+
+# Queued in place of frames when a slow client fell behind; its sender replies with a full snapshot.
+RESYNC = None
+
+
+class TickBroadcaster:
+    """Wakes on tick-store writes and fans one serialized frame out to every client, at most once per interval."""
+
+    def __init__(self, stream_service: Any, interval: float = FLUSH_INTERVAL_S):
+        self.stream_service = stream_service
+        self.interval = interval
+        # queue -> wants binary frames
+        self._clients: dict[asyncio.Queue, bool] = {}
+        self._task: asyncio.Task | None = None
+        self._last_version = -1
+        self._known_rows = 0
+        self._epoch = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake = asyncio.Event()
+        self._wake_pending = False
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def register(self, binary: bool = False) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._clients[queue] = binary
+        if self._task is None or self._task.done():
+            facade = self.stream_service.tick_store_facade
+            self._last_version = facade.get_version()
+            self._known_rows = facade.count
+            self._epoch = facade.epoch
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._wake_pending = False
+            facade.add_listener(self._notify)
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unregister(self, queue: asyncio.Queue) -> None:
+        self._clients.pop(queue, None)
+        if not self._clients:
+            self._wake.set()
+
+    def _notify(self) -> None:
+        # Runs on the feed thread for every tick; only the first one per flush crosses into the loop.
+        if self._wake_pending or self._loop is None:
+            return
+        self._wake_pending = True
+        try:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            pass
+
+    def flush(self) -> None:
+        facade = self.stream_service.tick_store_facade
+        if facade.get_version() == self._last_version:
+            return
+        since_version = self._last_version
+        versions: list[int] = []
+        text_frames: list[Any] = []
+        binary_frames: list[Any] = []
+        if not all(self._clients.values()):
+            version, frame = self.stream_service.tick_frame(since_version)
+            versions.append(version)
+            text_frames = [frame]
+        if any(self._clients.values()):
+            version, known_rows, binary_frames = self.stream_service.build_binary_frames(
+                since_version, self._known_rows
+            )
+            versions.append(version)
+            # Checked after building: a clear() at any point since the last flush means the
+            # packed row ids no longer match the key table binary clients hold.
+            if facade.epoch != self._epoch:
+                self._epoch = facade.epoch
+                binary_frames = [RESYNC]
+                known_rows = facade.count
+            self._known_rows = known_rows
+        # Both formats are cut from the same since_version; resuming from the older one
+        # can only resend rows, never skip them.
+        self._last_version = min(versions, default=since_version)
+        for queue, binary in self._clients.items():
+            frames = binary_frames if binary else text_frames
+            if frames and frames[0] is RESYNC:
+                while not queue.empty():
+                    queue.get_nowait()
+            try:
+                for frame in frames:
+                    queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC)
+
+    async def _run(self) -> None:
+        try:
+            while self._clients:
+                await self._wake.wait()
+                self._wake.clear()
+                self._wake_pending = False
+                self.flush()
+                await asyncio.sleep(self.interval)
+        finally:
+            self.stream_service.tick_store_facade.remove_listener(self._notify)
+            self._task = None
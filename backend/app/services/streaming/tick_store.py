@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import json
+import math
 import os
+import struct
 import threading
 import time
+from array import array
 from collections import deque
 from datetime import datetime
 from typing import Any, Callable
@@ -16,6 +19,21 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
+def extract_fields(row: dict[str, Any], field_map: tuple[tuple[str, tuple[str, ...]], ...]) -> dict[str, float]:
+    # First truthy alias wins, same as the `float(row.get(a) or row.get(b) or 0)` chains it replaces.
+    out: dict[str, float] = {}
+    get = row.get
+    for out_key, aliases in field_map:
+        for alias in aliases:
+            value = get(alias)
+            if value:
+                out[out_key] = float(value)
+                break
+        else:
+            out[out_key] = 0.0
+    return out
+
+
 def _bucket_epoch(ts: float, interval: str) -> int:
     dt = datetime.fromtimestamp(ts)
     if interval == "1minute":
@@ -29,73 +47,250 @@ def _bucket_epoch(ts: float, interval: str) -> int:
     return int(dt.replace(hour=0, minute=0, second=0, microsecond=0).timestamp())
 
 
+TICK_FIELDS = ("ltp", "oi", "volume", "iv", "bid", "ask", "change_pct", "_ts")
+_FIELD_INDEX = {name: idx for idx, name in enumerate(TICK_FIELDS)}
+
+# Binary tick frame: a version header followed by one fixed-size record per changed
+# row (row id, then every TICK_FIELDS column in order). Row ids resolve through key_table().
+# Columns go out as float64 rather than float32: the frame is a straight copy of the
+# column arrays, and _ts (epoch seconds) and large OI/volume lose precision in float32.
+TICK_FRAME_HEADER = struct.Struct("<Q")
+TICK_STRUCT = struct.Struct("<I%dd" % len(TICK_FIELDS))
+
+
+def _parse_tick_key(parts: list[str]) -> tuple[str, int, str] | None:
+    if len(parts) < 3:
+        return None
+    stock, strike_str, right = parts[0], parts[1], parts[2]
+    if right == "SPOT":
+        return None
+    try:
+        return stock, int(float(strike_str)), right
+    except Exception:
+        return None
+
+
+# Structure-of-arrays layout: every key owns a row, numeric fields live in one
+# packed float64 column each, anything else (feed_time, source, ...) in a small
+# per-row extras dict. Keys are parsed once, when their row is created.
 class TickStore:
     def __init__(self):
-        self._ticks: dict[str, dict[str, Any]] = {}
         self._lock = threading.Lock()
         self._version = 0
+        # Bumped by clear(); row ids are only meaningful within one epoch.
+        self._epoch = 0
+        self._columns = tuple(array("d") for _ in TICK_FIELDS)
+        self._keys: dict[str, int] = {}
+        self._row_keys: list[str] = []
+        self._meta: list[tuple[str, int, str] | None] = []
+        self._extras: list[dict[str, Any]] = []
+        self._row_versions = array("Q")
+        self._spot_rows: dict[str, int] = {}
+        self._listeners: list[Callable[[], None]] = []
+        # (version, every row) for the full-chain reads that snapshots and resyncs share.
+        self._full_rows: tuple[int, list[dict[str, Any]]] = (-1, [])
+
+    def _row_for(self, key: str) -> int:
+        row = self._keys.get(key)
+        if row is not None:
+            return row
+        row = len(self._row_keys)
+        self._keys[key] = row
+        self._row_keys.append(key)
+        parts = key.split(":")
+        self._meta.append(_parse_tick_key(parts))
+        self._extras.append({})
+        self._row_versions.append(0)
+        for column in self._columns:
+            column.append(0.0)
+        if len(parts) == 2 and parts[1] == "SPOT":
+            self._spot_rows[parts[0]] = row
+        return row
+
+    @staticmethod
+    def _split(data: dict[str, Any]) -> tuple[list[tuple[int, float]], dict[str, Any]]:
+        # Runs before the lock is taken: numeric strings are coerced and values that do
+        # not parse (None, "") are dropped, so a bad tick never half-writes a row.
+        values: list[tuple[int, float]] = []
+        extras: dict[str, Any] = {}
+        for name, value in data.items():
+            idx = _FIELD_INDEX.get(name)
+            if idx is None:
+                extras[name] = value
+                continue
+            number = _safe_float(value, math.nan)
+            if not math.isnan(number):
+                values.append((idx, number))
+        return values, extras
+
+    def _write(self, key: str, values: list[tuple[int, float]], extras: dict[str, Any], ts: float) -> None:
+        row = self._row_for(key)
+        for idx, number in values:
+            self._columns[idx][row] = number
+        if extras:
+            # Replaced, never mutated, so snapshots can share the old dict.
+            self._extras[row] = {**self._extras[row], **extras}
+        self._columns[_FIELD_INDEX["_ts"]][row] = ts
+        self._row_versions[row] = self._version
+
+    def update(self, key: str, data: dict[str, Any], ts: float | None = None) -> None:
+        if ts is None:
+            ts = time.time()
+        values, extras = self._split(data)
+        with self._lock:
+            self._version += 1
+            self._write(key, values, extras, ts)
+        for listener in self._listeners:
+            listener()
 
-    def update(self, key: str, data: dict[str, Any]) -> None:
+    def update_many(self, items: dict[str, dict[str, Any]], ts: float | None = None) -> None:
+        # One lock round, one version bump and one listener call for a whole feed batch.
+        if not items:
+            return
+        if ts is None:
+            ts = time.time()
+        prepared = [(key, *self._split(data)) for key, data in items.items()]
         with self._lock:
-            existing = self._ticks.get(key, {})
-            existing.update(data)
-            existing["_ts"] = time.time()
-            self._ticks[key] = existing
             self._version += 1
+            for key, values, extras in prepared:
+                self._write(key, values, extras, ts)
+        for listener in self._listeners:
+            listener()
+
+    # Listeners run on the writer's thread after every update. The list is copied on
+    # write so update() can iterate it without holding the lock.
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        self._listeners = [*self._listeners, listener]
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        self._listeners = [existing for existing in self._listeners if existing != listener]
 
     def get_all(self) -> dict[str, Any]:
         with self._lock:
-            return {"ticks": dict(self._ticks), "version": self._version}
+            version, keys, extras = self._version, self._row_keys[:], self._extras[:]
+            columns = tuple(column[:] for column in self._columns)
+        ticks = {}
+        for row, key in enumerate(keys):
+            tick = {name: columns[idx][row] for idx, name in enumerate(TICK_FIELDS)}
+            tick.update(extras[row])
+            ticks[key] = tick
+        return {"ticks": ticks, "version": version}
 
     def get_version(self) -> int:
-        with self._lock:
-            return self._version
+        # Written only under _lock; a bare attribute read is atomic, so pollers skip the lock.
+        return self._version
+
+    @property
+    def count(self) -> int:
+        return len(self._row_keys)
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
 
     def clear(self) -> None:
+        # Called on every reconnect. The version keeps counting up: broadcasters and
+        # pollers diff against the last version they saw, and rows written after the
+        # reset must still look newer than that.
         with self._lock:
-            self._ticks.clear()
-            self._version = 0
+            for column in self._columns:
+                del column[:]
+            del self._row_versions[:]
+            self._keys.clear()
+            self._row_keys.clear()
+            self._meta.clear()
+            self._extras.clear()
+            self._spot_rows.clear()
+            self._version += 1
+            self._epoch += 1
+            self._full_rows = (-1, [])
+        for listener in self._listeners:
+            listener()
+
+    def _snapshot(self) -> tuple[int, list[tuple[str, int, str] | None], array, tuple[array, ...]]:
+        # Slicing the columns is a memcpy, so the lock is held for a few copies and the
+        # per-row dicts are built after the feed thread can write again.
+        with self._lock:
+            return self._version, self._meta[:], self._row_versions[:], tuple(column[:] for column in self._columns)
+
+    @staticmethod
+    def _chain_rows(snapshot, since_version: int) -> list[dict[str, Any]]:
+        _, metas, row_versions, (ltp, oi, volume, iv, bid, ask, change_pct, ts) = snapshot
+        return [
+            {
+                "stock_code": meta[0],
+                "strike": meta[1],
+                "right": meta[2],
+                "ltp": ltp[row],
+                "oi": oi[row],
+                "volume": volume[row],
+                "iv": iv[row],
+                "bid": bid[row],
+                "ask": ask[row],
+                "change_pct": change_pct[row],
+                "last_updated": ts[row],
+            }
+            for row, meta in enumerate(metas)
+            if meta is not None and row_versions[row] > since_version
+        ]
+
+    def _all_rows(self) -> tuple[int, list[dict[str, Any]]]:
+        # Built at most once per version; callers share the list and must not mutate it.
+        cached = self._full_rows
+        if cached[0] == self._version:
+            return cached
+        snapshot = self._snapshot()
+        cached = (snapshot[0], self._chain_rows(snapshot, -1))
+        with self._lock:
+            # Rows are built outside the lock; only publish them if no write or clear()
+            # landed meanwhile, so the memo always matches the version it is filed under.
+            if self._version == snapshot[0]:
+                self._full_rows = cached
+        return cached
 
     def to_option_chain_delta(self) -> list[dict[str, Any]]:
+        return self._all_rows()[1]
+
+    def get_delta(self, since_version: int) -> tuple[int, list[dict[str, Any]]]:
+        # Rows touched after since_version; every row carries the version of its last
+        # write, so any number of readers can diff independently of each other.
+        if since_version < 1:
+            # Every written row has version >= 1, so this is the whole chain.
+            return self._all_rows()
+        snapshot = self._snapshot()
+        return snapshot[0], self._chain_rows(snapshot, since_version)
+
+    def pack_delta(self, since_version: int) -> tuple[int, bytes]:
         with self._lock:
-            rows: list[dict[str, Any]] = []
-            for key, tick in self._ticks.items():
-                parts = key.split(":")
-                if len(parts) < 3:
-                    continue
-                stock, strike_str, right = parts[0], parts[1], parts[2]
-                if right == "SPOT":
-                    continue
-                try:
-                    strike = int(float(strike_str))
-                except Exception:
-                    continue
-                rows.append({
-                    "stock_code": stock,
-                    "strike": strike,
-                    "right": right,
-                    "ltp": tick.get("ltp", 0),
-                    "oi": tick.get("oi", 0),
-                    "volume": tick.get("volume", 0),
-                    "iv": tick.get("iv", 0),
-                    "bid": tick.get("bid", 0),
-                    "ask": tick.get("ask", 0),
-                    "change_pct": tick.get("change_pct", 0),
-                    "last_updated": tick.get("_ts", 0),
-                })
-            return rows
+            rows = [
+                row
+                for row, meta in enumerate(self._meta)
+                if meta is not None and self._row_versions[row] > since_version
+            ]
+            buf = bytearray(TICK_FRAME_HEADER.size + TICK_STRUCT.size * len(rows))
+            TICK_FRAME_HEADER.pack_into(buf, 0, self._version)
+            offset = TICK_FRAME_HEADER.size
+            columns = self._columns
+            for row in rows:
+                TICK_STRUCT.pack_into(buf, offset, row, *(column[row] for column in columns))
+                offset += TICK_STRUCT.size
+            return self._version, bytes(buf)
+
+    def key_table(self, since_row: int = 0) -> tuple[int, dict[str, str]]:
+        with self._lock:
+            total = len(self._row_keys)
+            if since_row > total:
+                since_row = 0
+            return total, {
+                str(row): self._row_keys[row]
+                for row in range(since_row, total)
+                if self._meta[row] is not None
+            }
 
     def get_spot_prices(self) -> dict[str, float]:
         with self._lock:
-            result: dict[str, float] = {}
-            for key, tick in self._ticks.items():
-                parts = key.split(":")
-                if len(parts) == 2 and parts[1] == "SPOT":
-                    stock = parts[0]
-                    ltp = tick.get("ltp", 0)
-                    if ltp > 0:
-                        result[stock] = ltp
-            return result
+            ltp = self._columns[_FIELD_INDEX["ltp"]]
+            return {stock: ltp[row] for stock, row in self._spot_rows.items() if ltp[row] > 0}
 
 
 class ValidationCaptureStore:
@@ -201,6 +396,32 @@ class TickStoreFacade:
     def to_option_chain_delta(self) -> list[dict[str, Any]]:
         return self.store.to_option_chain_delta()
 
+    def get_version(self) -> int:
+        return self.store.get_version()
+
+    def get_delta(self, since_version: int) -> tuple[int, list[dict[str, Any]]]:
+        return self.store.get_delta(since_version)
+
+    @property
+    def count(self) -> int:
+        return self.store.count
+
+    @property
+    def epoch(self) -> int:
+        return self.store.epoch
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        self.store.add_listener(listener)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        self.store.remove_listener(listener)
+
+    def pack_delta(self, since_version: int) -> tuple[int, bytes]:
+        return self.store.pack_delta(since_version)
+
+    def key_table(self, since_row: int = 0) -> tuple[int, dict[str, str]]:
+        return self.store.key_table(since_row)
+
     def get_spot_prices(self) -> dict[str, float]:
         return self.store.get_spot_prices()
 
@@ -7,7 +7,7 @@
 #   Settings → Accelerator → GPU P100  (optional, keeps alive longer)
 #
 # RATE LIMIT PROTECTION:
-#   RateLimiter: max 1 REST call per 600ms → safe under 100/min ICICI limit
+#   AsyncRateLimiter: burst of 4, then 1 REST call per 625ms → safe under 100/min ICICI limit
 #   WebSocket:   push-based ticks → ZERO REST calls for live prices
 #   get_option_chain_quotes: called ONCE per expiry change, NEVER in loop
 #
@@ -15,7 +15,7 @@
 #   NO get_option_chain_quotes() in setInterval or while loop
 #   NO get_quotes() in a polling loop
 #   ALL live prices from WebSocket on_ticks callback ONLY
-#   ALL REST calls serialized through RateLimiter queue
+#   ALL REST calls paced through the AsyncRateLimiter token bucket
 #
 # TUNNEL PROVIDERS (tried in order, first success wins):
 #   1. localhost.run  — SSH, no account, no interstitial ← best
@@ -30,16 +30,19 @@ import urllib.request
 import stat
 import socket
 import re
+import queue
+import signal
 import threading
 import time
 import json
 import asyncio
-import queue
 import hashlib
 import shutil
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
 from typing import Optional, Dict, Any, List, Callable
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 from backend.app.clients.breeze import BreezeBrokerClient
 from backend.app.create_app import create_app
@@ -331,7 +334,7 @@ log = logging.getLogger("BreezeEngine")
 
 # ── Install dependencies ────────────────────────────────────────────────────────
 print("Installing packages...")
-PKGS = ["breeze-connect", "fastapi", "uvicorn[standard]", "websockets", "python-multipart"]
+PKGS = ["breeze-connect", "fastapi", "uvicorn[standard]", "uvloop", "httptools", "websockets", "python-multipart", "orjson"]
 for pkg in PKGS:
     subprocess.check_call(
         [sys.executable, "-m", "pip", "install", pkg, "-q"],
@@ -347,71 +350,93 @@ import uvicorn
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# RateLimiter
-# Token-bucket: max 100 REST calls/min = 1 per 600ms
-# All Breeze REST calls must go through enqueue()
+# AsyncRateLimiter
+# Token-bucket: max 100 REST calls/min — 4-call burst + 1 per 625ms
+# All Breeze REST calls must go through call() (async) or enqueue() (threads)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-class RateLimiter:
-    MIN_INTERVAL_MS = 600
-    MAX_QUEUE_SIZE  = 50
+class AsyncRateLimiter:
+    MAX_PER_MINUTE = 100
+    # Enough idle credit to send a 4-leg strategy at once. The refill rate leaves room
+    # for the burst, so BURST + 60s of refill never exceeds Breeze's 100 calls/minute;
+    # a full-minute bucket would let one refresh storm starve order placement.
+    BURST           = 4
+    MIN_INTERVAL_MS = 60_000 // (MAX_PER_MINUTE - BURST)   # steady-state spacing: 625ms
 
     def __init__(self):
-        self._queue      = queue.Queue(maxsize=self.MAX_QUEUE_SIZE)
-        self._last_call  = 0.0
-        self._call_times = deque(maxlen=100)
-        self._worker     = threading.Thread(target=self._process, daemon=True)
-        self._worker.start()
-        log.info("[RateLimiter] started — 1 call per 600ms max")
+        self._rate        = 1000 / self.MIN_INTERVAL_MS   # tokens per second
+        self._tokens      = float(self.BURST)
+        self._last_refill = time.monotonic()
+        self._lock        = threading.Lock()
+        self._waiting     = 0
+        self._call_times  = deque(maxlen=self.MAX_PER_MINUTE)
+        log.info(f"[RateLimiter] started — burst {self.BURST}, then 1 call per {self.MIN_INTERVAL_MS}ms")
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens      = min(self.BURST, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    def _try_acquire(self) -> float:
+        # Returns 0 when a token was taken, otherwise the seconds until one is due.
+        # The lock only guards the bucket arithmetic — waiters always sleep outside it.
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._call_times.append(time.monotonic())
+                return 0.0
+            return (1 - self._tokens) / self._rate
+
+    def _set_waiting(self, delta: int) -> None:
+        with self._lock:
+            self._waiting += delta
+
+    async def acquire(self) -> None:
+        wait = self._try_acquire()
+        if not wait:
+            return
+        self._set_waiting(1)
+        try:
+            while wait:
+                await asyncio.sleep(wait)
+                wait = self._try_acquire()
+        finally:
+            self._set_waiting(-1)
+
+    async def call(self, fn: Callable, *args, executor: Any = None, **kwargs) -> Any:
+        await self.acquire()
+        # Reads run on the loop's default pool; order placement passes the dedicated
+        # order executor so it never queues behind them. Unlike to_thread this skips
+        # copying the context; Breeze calls use no contextvars.
+        return await asyncio.get_running_loop().run_in_executor(executor, partial(fn, *args, **kwargs))
 
     def enqueue(self, fn: Callable, *args, **kwargs) -> Any:
-        result_box = {"result": None, "error": None}
-        done = threading.Event()
-
-        def task():
+        # Blocking variant for code already running on a worker thread.
+        wait = self._try_acquire()
+        if wait:
+            self._set_waiting(1)
             try:
-                result_box["result"] = fn(*args, **kwargs)
-            except Exception as exc:
-                result_box["error"] = exc
+                while wait:
+                    time.sleep(wait)
+                    wait = self._try_acquire()
             finally:
-                done.set()
-
-        try:
-            self._queue.put_nowait(task)
-        except queue.Full:
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                pass
-            self._queue.put_nowait(task)
-
-        done.wait(timeout=45)
-        if result_box["error"]:
-            raise result_box["error"]
-        return result_box["result"]
-
-    def _process(self):
-        while True:
-            try:
-                task = self._queue.get(timeout=1)
-            except queue.Empty:
-                continue
-            now = time.monotonic()
-            elapsed_ms = (now - self._last_call) * 1000
-            if elapsed_ms < self.MIN_INTERVAL_MS:
-                time.sleep((self.MIN_INTERVAL_MS - elapsed_ms) / 1000)
-            self._last_call = time.monotonic()
-            self._call_times.append(time.time())
-            task()
+                self._set_waiting(-1)
+        return fn(*args, **kwargs)
 
     @property
     def calls_last_minute(self) -> int:
-        cutoff = time.time() - 60
-        return sum(1 for t in self._call_times if t > cutoff)
+        # Timestamps are appended in order, so expired ones are always at the left end.
+        cutoff = time.monotonic() - 60
+        with self._lock:
+            call_times = self._call_times
+            while call_times and call_times[0] <= cutoff:
+                call_times.popleft()
+            return len(call_times)
 
     @property
     def queue_depth(self) -> int:
-        return self._queue.qsize()
+        return self._waiting
 
 
 def _safe_float(value, default=0.0) -> float:
@@ -421,6 +446,33 @@ def _safe_float(value, default=0.0) -> float:
         return default
 
 
+@lru_cache(maxsize=16)
+def _weekly_expiries(target_day: int, count: int, today_ordinal: int, skip_today: bool) -> tuple:
+    today = date.fromordinal(today_ordinal)
+    first = (target_day - today.weekday()) % 7
+    if first == 0 and skip_today:
+        first = 7
+    results = []
+    for days_away in range(first, 60, 7)[:count]:
+        d = today + timedelta(days=days_away)
+        results.append({
+            "date":      d.strftime("%d-%b-%Y"),
+            "label":     d.strftime("%d %b %y"),
+            "days_away": days_away,
+            "weekday":   d.strftime("%A"),
+            "timestamp": d.isoformat(),
+        })
+    return tuple(results)
+
+
+@lru_cache(maxsize=1)
+def _day_bounds(day_ordinal: int) -> tuple:
+    # Book queries span the whole local trading day; keyed on the ordinal so the
+    # cached pair rolls over at midnight.
+    day = date.fromordinal(day_ordinal).isoformat()
+    return f"{day}T00:00:00.000Z", f"{day}T23:59:59.000Z"
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # BreezeEngine
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -433,10 +485,11 @@ class BreezeEngine:
         self.session_key  = ""
         self.api_key      = ""
         self.api_secret   = ""
+        self._customer_cache: Dict[str, dict] = {}
         self.connected    = False
         self.ws_running   = False
         self.subscribed   = set()
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = AsyncRateLimiter()
         self.broker_client = BreezeBrokerClient(self.rate_limiter)
         self.tick_store   = TickStore()
         self.candle_store = CandleStore()
@@ -480,17 +533,20 @@ class BreezeEngine:
         self.candle_store.clear()
         log.info(f"[Engine] connected — session:{self.session_key[:12]}...")
 
-        user_info = {}
-        try:
-            det = self.broker_client.get_customer_details()
-            if isinstance(det, dict) and det.get("Success"):
-                s = det["Success"]
-                user_info = {
-                    "name":  s.get("name", ""),
-                    "email": s.get("email", ""),
-                }
-        except Exception as exc:
-            log.warning(f"[Engine] get_customer_details: {exc}")
+        # Reconnecting with the same session skips a rate-limited customer-details call.
+        user_info = self._customer_cache.get(self.session_key, {})
+        if not user_info:
+            try:
+                det = self.broker_client.get_customer_details()
+                if isinstance(det, dict) and det.get("Success"):
+                    s = det["Success"]
+                    user_info = {
+                        "name":  s.get("name", ""),
+                        "email": s.get("email", ""),
+                    }
+                    self._customer_cache[self.session_key] = user_info
+            except Exception as exc:
+                log.warning(f"[Engine] get_customer_details: {exc}")
 
         return {
             "success":       True,
@@ -515,8 +571,13 @@ class BreezeEngine:
 
     @staticmethod
     def generate_checksum(timestamp: str, payload: dict, secret: str) -> str:
-        body_str = json.dumps(payload)
-        return hashlib.sha256((timestamp + body_str + secret).encode("utf-8")).hexdigest()
+        # Breeze hashes the exact json.dumps() text (", " / ": " separators, insertion
+        # order), so the body must stay stdlib-formatted; feed the parts straight into
+        # the digest instead of concatenating and re-encoding one big string.
+        digest = hashlib.sha256(timestamp.encode("utf-8"))
+        digest.update(json.dumps(payload).encode("utf-8"))
+        digest.update(secret.encode("utf-8"))
+        return digest.hexdigest()
 
     # ── Expiry utilities ──────────────────────────────────────────────────────
 
@@ -525,22 +586,9 @@ class BreezeEngine:
         is_sensex  = "SENSEX" in stock_code.upper() or "BSESEN" in stock_code.upper()
         target_day = 3 if is_sensex else 1
         today      = datetime.now().date()
-        results    = []
-        for i in range(60):
-            d = today + timedelta(days=i)
-            if d.weekday() == target_day:
-                if i == 0 and datetime.utcnow().hour >= 10:
-                    continue
-                results.append({
-                    "date":      d.strftime("%d-%b-%Y"),
-                    "label":     d.strftime("%d %b %y"),
-                    "days_away": (d - today).days,
-                    "weekday":   d.strftime("%A"),
-                    "timestamp": d.isoformat(),
-                })
-                if len(results) >= count:
-                    break
-        return results
+        # Cached per day; callers get copies so they can't mutate the shared rows.
+        expiries   = _weekly_expiries(target_day, count, today.toordinal(), datetime.utcnow().hour >= 10)
+        return [dict(expiry) for expiry in expiries]
 
     # ── REST: Option Chain ────────────────────────────────────────────────────
 
@@ -568,13 +616,13 @@ class BreezeEngine:
 
     # ── REST: Orders ──────────────────────────────────────────────────────────
 
-    def place_order(self, leg: dict) -> dict:
+    def _order_kwargs(self, leg: dict) -> dict:
         if not self.connected:
             raise RuntimeError("Not connected")
 
         right_norm = "Call" if (leg.get("right") or "call").lower().startswith("c") else "Put"
 
-        return self.broker_client.place_order(
+        return dict(
             stock_code=leg["stock_code"],
             exchange_code=leg.get("exchange_code", "NFO"),
             product=leg.get("product", "options"),
@@ -592,9 +640,18 @@ class BreezeEngine:
             user_remark=leg.get("user_remark", "OptionsTerminalV7"),
         )
 
+    def place_order(self, leg: dict) -> dict:
+        return self.broker_client.place_order(**self._order_kwargs(leg))
+
+    async def place_order_async(self, leg: dict) -> dict:
+        return await self.broker_client.place_order_async(**self._order_kwargs(leg))
+
     def place_strategy_order(self, legs: List[dict]) -> List[dict]:
         return self.execution_workflow.place_strategy_order(legs)
 
+    async def place_strategy_order_async(self, legs: List[dict]) -> List[dict]:
+        return await self.execution_workflow.place_strategy_order_async(legs)
+
     def square_off_position(self, leg: dict) -> dict:
         return self.execution_workflow.square_off_position(leg)
 
@@ -630,21 +687,21 @@ class BreezeEngine:
     def get_order_book(self) -> dict:
         if not self.connected:
             raise RuntimeError("Not connected")
-        now = datetime.now()
+        from_date, to_date = _day_bounds(date.today().toordinal())
         return self.broker_client.get_order_list(
             exchange_code="NFO",
-            from_date=now.strftime("%Y-%m-%dT00:00:00.000Z"),
-            to_date=now.strftime("%Y-%m-%dT23:59:59.000Z"),
+            from_date=from_date,
+            to_date=to_date,
         )
 
     def get_trade_book(self) -> dict:
         if not self.connected:
             raise RuntimeError("Not connected")
-        now = datetime.now()
+        from_date, to_date = _day_bounds(date.today().toordinal())
         return self.broker_client.get_trade_list(
             exchange_code="NFO",
-            from_date=now.strftime("%Y-%m-%dT00:00:00.000Z"),
-            to_date=now.strftime("%Y-%m-%dT23:59:59.000Z"),
+            from_date=from_date,
+            to_date=to_date,
         )
 
     def get_positions(self) -> dict:
@@ -805,7 +862,18 @@ runtime_app = app
 
 def start_uvicorn_thread():
     t = threading.Thread(
-        target=lambda: uvicorn.run(runtime_app, host="0.0.0.0", port=8000, log_level="warning"),
+        target=lambda: uvicorn.run(
+            runtime_app,
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            ws="websockets",
+            # Reconnect storms after a tunnel blip arrive all at once; don't drop SYNs.
+            backlog=2048,
+            log_level="warning",
+            access_log=False,
+        ),
         daemon=True,
         name="uvicorn",
     )
@@ -814,75 +882,113 @@ def start_uvicorn_thread():
 
 
 def wait_for_port(port: int = 8000, timeout: int = 15) -> bool:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
+    # uvicorn is usually listening within ~100ms; start polling fast and back off.
+    deadline = time.monotonic() + timeout
+    delay    = 0.025
+    while time.monotonic() < deadline:
         try:
             with socket.create_connection(("127.0.0.1", port), timeout=1):
                 return True
         except OSError:
-            time.sleep(0.5)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.25)
     return False
 
 
-def try_localhost_run() -> Optional[str]:
+_LHR_URL    = re.compile(rb"https://[a-z0-9\-]+\.lhr\.life")
+_SERVEO_URL = re.compile(rb"https://[a-z0-9]+\.serveo\.net")
+_CF_URL     = re.compile(rb"https://[a-zA-Z0-9-]+\.trycloudflare\.com")
+# cloudflared logs other trycloudflare.com URLs (the API endpoint) before its banner;
+# the tunnel URL is the one printed after this line.
+_CF_BANNER  = b"Your quick Tunnel has been created"
+
+_TUNNEL_PROCS: Dict[str, subprocess.Popen] = {}   # public URL -> tunnel child
+_TUNNEL_LOCK  = threading.Lock()                   # orders registration against race_tunnels' cancel
+
+
+def _start_tunnel(
+    cmd: List[str],
+    log_path: str,
+    pattern: "re.Pattern[bytes]",
+    timeout: float,
+    cancel: Optional[threading.Event] = None,
+    after: Optional[bytes] = None,
+) -> Optional[str]:
+    # The tunnel prints its public URL on stdout. A reader thread tees the pipe into
+    # log_path and hands over the first match (from the line containing `after`
+    # onwards, when given) as soon as the line arrives; it keeps draining afterwards
+    # so the child never blocks on a full pipe.
+    proc  = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    found = queue.Queue(maxsize=1)
+
+    def _pump() -> None:
+        armed = after is None
+        with open(log_path, "wb") as log_file:
+            for line in iter(proc.stdout.readline, b""):
+                log_file.write(line)
+                log_file.flush()
+                if not armed:
+                    armed = after in line
+                if armed and found.empty():
+                    match = pattern.search(line)
+                    if match:
+                        found.put(match.group(0).decode("ascii"))
+
+    threading.Thread(target=_pump, daemon=True, name=f"tunnel-{os.path.basename(cmd[0])}").start()
+    deadline = time.monotonic() + timeout
+    url      = None
+    while url is None and time.monotonic() < deadline and not (cancel and cancel.is_set()):
+        try:
+            url = found.get(timeout=0.25)
+        except queue.Empty:
+            pass
+    if url is not None:
+        with _TUNNEL_LOCK:
+            # Checked under the lock race_tunnels holds while it cancels, so a tunnel is
+            # either registered before the losers are reaped or never registered at all.
+            if not (cancel and cancel.is_set()):
+                _TUNNEL_PROCS[url] = proc
+                return url
+    # Timed out, or another provider already won the race: don't leave a tunnel up.
+    proc.terminate()
+    return None
+
+
+def try_localhost_run(cancel: Optional[threading.Event] = None) -> Optional[str]:
     if not shutil.which("ssh"):
         return None
     try:
-        log_path = "/tmp/lhr.log"
-        open(log_path, "w").close()
-        subprocess.Popen(
+        return _start_tunnel(
             ["ssh", "-R", "80:localhost:8000",
              "-o", "StrictHostKeyChecking=no",
              "-o", "ServerAliveInterval=30",
              "-o", "ConnectTimeout=15",
              "nokey@localhost.run"],
-            stdout=open(log_path, "a"), stderr=subprocess.STDOUT,
+            "/tmp/lhr.log", _LHR_URL, timeout=40, cancel=cancel,
         )
-        pat      = re.compile(r"https://[a-z0-9\-]+\.lhr\.life")
-        deadline = time.time() + 40
-        while time.time() < deadline:
-            time.sleep(2)
-            try:
-                m = pat.search(open(log_path).read())
-                if m:
-                    return m.group(0)
-            except Exception:
-                pass
     except Exception:
         pass
     return None
 
 
-def try_serveo() -> Optional[str]:
+def try_serveo(cancel: Optional[threading.Event] = None) -> Optional[str]:
     if not shutil.which("ssh"):
         return None
     try:
-        log_path = "/tmp/serveo.log"
-        open(log_path, "w").close()
-        subprocess.Popen(
+        return _start_tunnel(
             ["ssh", "-R", "80:localhost:8000",
              "-o", "StrictHostKeyChecking=no",
              "-o", "ServerAliveInterval=30",
              "-o", "ConnectTimeout=15",
              "serveo.net"],
-            stdout=open(log_path, "a"), stderr=subprocess.STDOUT,
+            "/tmp/serveo.log", _SERVEO_URL, timeout=40, cancel=cancel,
         )
-        pat      = re.compile(r"https://[a-z0-9]+\.serveo\.net")
-        deadline = time.time() + 40
-        while time.time() < deadline:
-            time.sleep(2)
-            try:
-                m = pat.search(open(log_path).read())
-                if m:
-                    return m.group(0)
-            except Exception:
-                pass
     except Exception:
         pass
     return None
 
 
-def try_cloudflare() -> Optional[str]:
+def try_cloudflare(cancel: Optional[threading.Event] = None) -> Optional[str]:
     cf = "/tmp/cloudflared"
     if not os.path.exists(cf):
         try:
@@ -897,159 +1003,195 @@ def try_cloudflare() -> Optional[str]:
             print(f"  cloudflared download failed: {exc}")
             return None
 
-    log_path = "/tmp/cf.log"
-    open(log_path, "w").close()
     try:
-        subprocess.Popen(
+        return _start_tunnel(
             [cf, "tunnel", "--url", "http://localhost:8000", "--no-autoupdate"],
-            stdout=open(log_path, "a"), stderr=subprocess.STDOUT,
+            "/tmp/cf.log", _CF_URL, timeout=90, cancel=cancel, after=_CF_BANNER,
         )
-        pat      = re.compile(r"https://[a-zA-Z0-9-]+\.trycloudflare\.com")
-        deadline = time.time() + 90
-        while time.time() < deadline:
-            time.sleep(3)
-            try:
-                urls = pat.findall(open(log_path).read())
-                if urls:
-                    return urls[-1]
-            except Exception:
-                pass
     except Exception as exc:
         print(f"  Cloudflare error: {exc}")
     return None
 
 
+TUNNEL_PROVIDERS = (
+    (try_localhost_run, "localhost.run (SSH — no interstitial)"),
+    (try_serveo,        "serveo.net    (SSH — no interstitial)"),
+    (try_cloudflare,    "Cloudflare    (has browser interstitial)"),
+)
+
+
+def race_tunnels(providers=TUNNEL_PROVIDERS) -> Optional[str]:
+    """Start every tunnel provider at once and return the most preferred URL.
+
+    Preference order is kept on purpose: the SSH tunnels have no browser
+    interstitial, which Cloudflare's quick tunnel puts in front of API calls.
+    The cost is latency. A URL that is already up is held until every more
+    preferred provider has finished. In the worst case that means waiting out
+    the SSH providers' 40s timeout while Cloudflare is already serving. Losers
+    are told to shut their tunnels once a winner is chosen.
+    """
+    cancel  = threading.Event()
+    urls: List[Optional[str]] = [None] * len(providers)
+    pool    = ThreadPoolExecutor(max_workers=len(providers), thread_name_prefix="tunnel")
+    futures = {pool.submit(fn, cancel): idx for idx, (fn, _) in enumerate(providers)}
+    pending = set(futures)
+    winner  = None
+    try:
+        for fut in as_completed(futures):
+            idx = futures[fut]
+            pending.discard(fut)
+            try:
+                urls[idx] = fut.result()
+            except Exception:
+                urls[idx] = None
+            print(f"  {'✓' if urls[idx] else '✗'} {providers[idx][1]}")
+            best = next((i for i, url in enumerate(urls) if url), None)
+            if best is not None and all(futures[other] > best for other in pending):
+                winner = urls[best]
+                return winner
+        return None
+    finally:
+        with _TUNNEL_LOCK:
+            cancel.set()
+            for url in [url for url in _TUNNEL_PROCS if url != winner]:
+                _TUNNEL_PROCS.pop(url).terminate()
+        pool.shutdown(wait=False)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAIN
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_ENDPOINT_LINES = (
+    "  Endpoints:",
+    "    POST  /api/connect          authenticate (generate_session)",
+    "    GET   /api/expiries         weekly expiry dates",
+    "    GET   /api/optionchain      snapshot — call ONCE per expiry",
+    "    POST  /api/ws/subscribe     subscribe Breeze WS feeds",
+    "    WS    /ws/ticks             live tick stream to frontend",
+    "    POST  /api/strategy/execute multi-leg concurrent order",
+    "    POST  /api/preview          broker-native preview aggregation",
+    "    POST  /api/margin           broker-native margin aggregation",
+    "    GET   /api/diagnostics/execution-validation recent preview/margin captures",
+    "    POST  /api/squareoff        exit / square-off a position",
+    "    POST  /api/order/cancel     cancel pending order",
+    "    PATCH /api/order/modify     modify order price/qty",
+    "    GET   /api/orders           order book (today)",
+    "    GET   /api/trades           trade book (today)",
+    "    GET   /api/positions        portfolio positions + holdings",
+    "    GET   /api/funds            available margin / funds",
+    "    GET   /api/historical       OHLCV candle data",
+    "    GET   /api/ratelimit        rate limiter status",
+    "    GET   /health  /ping  /     health check",
+    "",
+)
+
+_STEP_LINES = (
+    "  Steps:",
+    "  1. Copy URL above",
+    "  2. Arena → Connect Broker → paste URL",
+    "  3. Enter API Key, API Secret, today's Session Token",
+    "  4. Click Validate Live → should show 'Connected via BreezeEngine v7'",
+    "",
+    "  Daily Session Token:",
+    "    https://api.icicidirect.com/apiuser/login?api_key=YOUR_KEY",
+    "    Login → copy ?apisession=XXXXX from the redirect URL",
+    "",
+)
+
+
+def _write_block(lines: List[str]) -> None:
+    # One write per banner block: each print() takes the stdout lock and flushes
+    # through the Jupyter bridge on its own.
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def main():
     # FIX: SEP defined at the top of main() so all print() calls below can use it
     SEP = "=" * 68
 
-    print(f"\n{SEP}")
-    print("  ICICI BREEZE BACKEND v7 — BreezeEngine")
-    print(SEP)
-    print()
-
+    lines = ["", SEP, "  ICICI BREEZE BACKEND v7 — BreezeEngine", SEP, ""]
     if AUTH_ENABLED:
-        print("  ⚠️  AUTH ENABLED — X-Terminal-Auth header required")
-        print(f"  Token: {BACKEND_AUTH_TOKEN}")
-        print()
+        lines += ["  ⚠️  AUTH ENABLED — X-Terminal-Auth header required", f"  Token: {BACKEND_AUTH_TOKEN}", ""]
     else:
-        print("  🔓 Auth DISABLED (default) — set TERMINAL_AUTH_TOKEN env var to enable")
-        print()
-
-    print("  Endpoints:")
-    print("    POST  /api/connect          authenticate (generate_session)")
-    print("    GET   /api/expiries         weekly expiry dates")
-    print("    GET   /api/optionchain      snapshot — call ONCE per expiry")
-    print("    POST  /api/ws/subscribe     subscribe Breeze WS feeds")
-    print("    WS    /ws/ticks             live tick stream to frontend")
-    print("    POST  /api/strategy/execute multi-leg concurrent order")
-    print("    POST  /api/preview          broker-native preview aggregation")
-    print("    POST  /api/margin           broker-native margin aggregation")
-    print("    GET   /api/diagnostics/execution-validation recent preview/margin captures")
-    print("    POST  /api/squareoff        exit / square-off a position")
-    print("    POST  /api/order/cancel     cancel pending order")
-    print("    PATCH /api/order/modify     modify order price/qty")
-    print("    GET   /api/orders           order book (today)")
-    print("    GET   /api/trades           trade book (today)")
-    print("    GET   /api/positions        portfolio positions + holdings")
-    print("    GET   /api/funds            available margin / funds")
-    print("    GET   /api/historical       OHLCV candle data")
-    print("    GET   /api/ratelimit        rate limiter status")
-    print("    GET   /health  /ping  /     health check")
-    print()
-
-    print("Starting FastAPI on port 8000...")
+        lines += ["  🔓 Auth DISABLED (default) — set TERMINAL_AUTH_TOKEN env var to enable", ""]
+    lines += _ENDPOINT_LINES
+    _write_block(lines)
+
+    print("Starting FastAPI on port 8000 and finding a public tunnel (3 providers raced, SSH preferred)...\n")
     start_uvicorn_thread()
+    # Tunnels only forward to localhost:8000 once a request arrives, so they can come up
+    # while uvicorn is still importing and binding; nothing here waits on the other.
+    tunnel_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tunnel-race")
+    tunnel      = tunnel_pool.submit(race_tunnels)
     if wait_for_port(8000, 15):
         print("FastAPI running ✓\n")
     else:
         print("WARNING: FastAPI may not have started — check for port conflicts\n")
 
-    print("Finding public tunnel (3 providers tried in order)...\n")
-    public_url = None
-
-    for fn, name in [
-        (try_localhost_run, "localhost.run (SSH — no interstitial)"),
-        (try_serveo,        "serveo.net    (SSH — no interstitial)"),
-        (try_cloudflare,    "Cloudflare    (has browser interstitial)"),
-    ]:
-        print(f"  Trying {name}...")
-        url = fn()
-        if url:
-            public_url = url
-            print(f"  ✓ {url}\n")
-            break
-        print("  ✗ unavailable, trying next...\n")
-
-    print(SEP)
+    public_url = tunnel.result()
+    tunnel_pool.shutdown(wait=False)
+    print(f"\n  ✓ {public_url}\n" if public_url else "\n  ✗ no tunnel came up\n")
 
+    lines = [SEP]
     if public_url:
         is_cf = "trycloudflare" in public_url
-        print("  ✅  BACKEND IS LIVE!")
-        print(SEP)
-        print()
-        print(f"  URL ▶  {public_url}")
-        print()
-        print("  ─" * 34)
-        print("  COPY THIS → paste into Arena → Connect Broker field")
-        print(f"  {public_url}")
-        print("  ─" * 34)
-        print()
-        print(f"  Health:    {public_url}/health")
-        print(f"  WS Ticks:  {public_url.replace('https', 'wss')}/ws/ticks")
-        print(f"  Connect:   {public_url}/api/connect  (POST)")
-
+        lines += [
+            "  ✅  BACKEND IS LIVE!",
+            SEP,
+            "",
+            f"  URL ▶  {public_url}",
+            "",
+            "  ─" * 34,
+            "  COPY THIS → paste into Arena → Connect Broker field",
+            f"  {public_url}",
+            "  ─" * 34,
+            "",
+            f"  Health:    {public_url}/health",
+            f"  WS Ticks:  {public_url.replace('https', 'wss')}/ws/ticks",
+            f"  Connect:   {public_url}/api/connect  (POST)",
+        ]
         if is_cf:
-            print()
-            print("  ⚠️  Cloudflare URL — if Arena shows 'Failed to fetch':")
-            print(f"       1. Open in a NEW browser tab:  {public_url}/health")
-            print('       2. Wait for {\"status\":\"online\"}')
-            print("       3. Close tab → retry in Arena")
+            lines += [
+                "",
+                "  ⚠️  Cloudflare URL — if Arena shows 'Failed to fetch':",
+                f"       1. Open in a NEW browser tab:  {public_url}/health",
+                '       2. Wait for {"status":"online"}',
+                "       3. Close tab → retry in Arena",
+            ]
     else:
-        print("  ❌  No public tunnel found.")
-        print("      Make sure Kaggle Internet is ON (Settings → Internet → ON)")
-        print("      Then re-run this cell.")
-
-    print()
-    print(SEP)
-    print()
-    print("  Steps:")
-    print("  1. Copy URL above")
-    print("  2. Arena → Connect Broker → paste URL")
-    print("  3. Enter API Key, API Secret, today's Session Token")
-    print("  4. Click Validate Live → should show 'Connected via BreezeEngine v7'")
-    print()
-    print("  Daily Session Token:")
-    print("    https://api.icicidirect.com/apiuser/login?api_key=YOUR_KEY")
-    print("    Login → copy ?apisession=XXXXX from the redirect URL")
-    print()
-    print(SEP)
-    print()
-    print("  Backend running. Keep this cell alive.")
-    print("  Press the Kaggle ■ Stop button to quit.\n")
+        lines += [
+            "  ❌  No public tunnel found.",
+            "      Make sure Kaggle Internet is ON (Settings → Internet → ON)",
+            "      Then re-run this cell.",
+        ]
+    lines += ["", SEP, ""]
+    lines += _STEP_LINES
+    lines += [SEP, "", "  Backend running. Keep this cell alive.", "  Press the Kaggle ■ Stop button to quit.\n"]
+    _write_block(lines)
 
+    shutdown = threading.Event()
     try:
-        beat = 0
-        while True:
-            time.sleep(30)
-            beat += 1
-            if beat % 2 == 0:   # heartbeat every 60s
-                ts = datetime.utcnow().strftime("%H:%M:%S")
-                print(
-                    f"  [{ts} UTC]"
-                    f"  connected={engine.connected}"
-                    f"  ws={engine.ws_running}"
-                    f"  subs={len(engine.subscribed)}"
-                    f"  REST/min={engine.rate_limiter.calls_last_minute}"
-                    f"  ticks={engine.tick_store.get_version()}"
-                )
-    except KeyboardInterrupt:
-        print("\nShutting down...")
-        engine.disconnect()
+        signal.signal(signal.SIGTERM, lambda *_: shutdown.set())
+    except ValueError:
+        pass   # not on the main thread; Ctrl-C / Stop still ends the loop below
 
+    try:
+        while not shutdown.wait(60):   # heartbeat every 60s
+            # Through the logger so it serialises with uvicorn's output; the record
+            # carries its own timestamp and is only formatted when INFO is enabled.
+            log.info(
+                "[Heartbeat] connected=%s ws=%s subs=%d REST/min=%d ticks=%d",
+                engine.connected,
+                engine.ws_running,
+                len(engine.subscribed),
+                engine.rate_limiter.calls_last_minute,
+                engine.tick_store.get_version(),
+            )
+    except KeyboardInterrupt:
+        pass
+    print("\nShutting down...")
+    engine.disconnect()
 
 main()
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
 import sqlite3
+import threading
+import time
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
+from backend.app.clients.breeze.client import BreezeBrokerClient
+from backend.app.core.executor import _pool_size, get_order_executor
 from backend.app.core.state import BackendState
 from backend.app.create_app import create_app
 from backend.app.services.market.market_data_service import MarketDataService
 from backend.app.services.market.market_service import MarketService
+from backend.app.services.orders.execution_workflow import ExecutionWorkflow
+from backend.app.services.orders.order_result import OrderResult
 from backend.app.services.orders.order_service import OrderService
+from backend.app.services.portfolio.portfolio_service import PortfolioService
+from backend.app.services.session.connection_service import ConnectionService
+from backend.app.services.streaming.realtime_manager import RealtimeManager
+from backend.app.services.streaming.stream_service import StreamService
+from backend.app.services.streaming.tick_broadcaster import RESYNC, TickBroadcaster
+from backend.app.services.streaming.tick_store import TICK_FRAME_HEADER, TICK_STRUCT, TickStore, TickStoreFacade
 from backend.app.storage.audit_log_repo import AuditLogRepository
 from backend.app.storage.database import init_sqlite
 from backend.app.storage.layout_repo import LayoutRepository
@@ -76,6 +91,8 @@ class FakeReviewManager:
 class FakeTickStore:
     def __init__(self):
         self.version = 1
+        self.epoch = 0
+        self.listeners = []
         self.ticks = {
             "NIFTY:22000:CE": {
                 "ltp": 112.5,
@@ -96,6 +113,24 @@ class FakeTickStore:
     def get_version(self):
         return self.version
 
+    @property
+    def count(self):
+        return len(self.ticks)
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def bump(self, version):
+        self.version = version
+        for listener in list(self.listeners):
+            listener()
+
+    def get_delta(self, since_version):
+        return self.version, self.to_option_chain_delta() if since_version < self.version else []
+
     def to_option_chain_delta(self):
         return [{
             "stock_code": "NIFTY",
@@ -152,6 +187,9 @@ class FakeRateLimiter:
     def enqueue(self, fn, *args, **kwargs):
         return fn(*args, **kwargs)
 
+    async def call(self, fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
 
 class FakeBreeze:
     def get_quotes(self, **kwargs):
@@ -169,6 +207,9 @@ class FakeBrokerClient:
             raise self.quotes
         return self.quotes
 
+    async def get_quotes_async(self, **kwargs):
+        return self.get_quotes(**kwargs)
+
 
 class FakeEngine:
     def __init__(self):
@@ -215,9 +256,15 @@ class FakeEngine:
             "ltp": 112.5,
         }]
 
+    async def fetch_option_chain_async(self, *args):
+        return self.fetch_option_chain(*args)
+
     def get_quote(self, *args):
         return {"Success": [{"args": list(args)}]}
 
+    async def get_quote_async(self, *args):
+        return self.get_quote(*args)
+
     def get_historical(self, *args):
         _ = args
         return [{"datetime": "2026-03-26 09:15:00", "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 10}]
@@ -246,6 +293,9 @@ class FakeEngine:
     def place_strategy_order(self, legs):
         return [{"leg_index": idx, "success": True, "order_id": f"OID-{idx}", "error": ""} for idx, _ in enumerate(legs)]
 
+    async def place_strategy_order_async(self, legs):
+        return self.place_strategy_order(legs)
+
     def square_off_position(self, payload):
         _ = payload
         return {"Status": 200, "Success": {"order_id": "SQ-1"}}
@@ -323,6 +373,17 @@ def test_layout_routes_persist_to_sqlite(tmp_path):
     assert len(list_response.json()["data"]) == 1
 
 
+def test_rate_limit_status_scales_with_limiter_limit(tmp_path):
+    client = build_client(tmp_path)
+    limiter = client.app.state.backend_state.engine.rate_limiter
+    statuses = []
+    for calls in (60, 85, 99):
+        limiter.calls_last_minute = calls
+        statuses.append(client.get("/api/diagnostics/rate-limits").json()["rate_limits"]["status"])
+
+    assert statuses == ["healthy", "warning", "critical"]
+
+
 def test_automation_routes_write_audit_log(tmp_path):
     client = build_client(tmp_path)
     create_response = client.post("/api/automation/rules", json={"id": "rule-1", "name": "Guard"})
@@ -399,12 +460,41 @@ def test_stream_routes_and_websocket_payloads(tmp_path):
     assert ticks.json()["changed"] is True
     assert ticks.json()["ticks"][0]["stock_code"] == "NIFTY"
 
+    delta = client.get("/api/option_chain/delta")
+    assert delta.status_code == 200
+    assert delta.json()["success"] is True
+    assert delta.json()["data"][0]["stock_code"] == "NIFTY"
+
     with client.websocket_connect("/ws/ticks") as websocket:
         payload = websocket.receive_json()
         assert payload["type"] == "tick_update"
         assert payload["spot_prices"]["NIFTY"] == 22105.4
         assert "candle_streams" in payload
 
+    with client.websocket_connect("/ws/status") as websocket:
+        assert websocket.receive_json() == {"type": "status", "version": 1, "count": 2, "ws_live": True}
+        client.app.state.backend_state.engine.tick_store.bump(2)
+        assert websocket.receive_json()["version"] == 2
+
+
+def test_ticks_long_poll_returns_on_next_store_write(tmp_path):
+    client = build_client(tmp_path)
+    store = client.app.state.backend_state.engine.tick_store
+
+    idle = client.get("/api/ticks", params={"since_version": 1, "wait": 0.05})
+    assert idle.json() == {"changed": False, "version": 1}
+    assert store.listeners == []
+
+    timer = threading.Timer(0.05, store.bump, args=(2,))
+    timer.start()
+    started = time.monotonic()
+    woken = client.get("/api/ticks", params={"since_version": 1, "wait": 5})
+    timer.join()
+
+    assert woken.json()["changed"] is True
+    assert woken.json()["version"] == 2
+    assert time.monotonic() - started < 2
+
 
 def test_sqlite_layout_recovery_and_error_cases(tmp_path):
     db_path = Path(tmp_path) / "recovery.db"
@@ -462,6 +552,20 @@ def test_market_service_returns_broker_error_when_quote_call_raises():
     assert payload == {"success": False, "error": "quote failure"}
 
 
+def test_market_service_resolves_spot_through_async_quote_path():
+    engine = FakeEngine()
+    engine.tick_store = TickStore()
+    engine.market_data_service = None
+    service = MarketService(engine)
+    service.market_data = engine.market_data_service = MarketDataService(engine)
+
+    payload = asyncio.run(service.get_spot_async("NIFTY", "NSE"))
+
+    assert payload["spot"] == 22105.4
+    assert payload["source"] == "rest_quote"
+    assert engine.tick_store.get_spot_prices()["NIFTY"] == 22105.4
+
+
 class FakeExecutionWorkflow:
     def __init__(self, *, preview_error=None, place_results=None):
         self.preview_error = preview_error
@@ -490,6 +594,9 @@ class FakeExecutionWorkflow:
         _ = legs
         return self.place_results
 
+    async def place_strategy_order_async(self, legs):
+        return self.place_strategy_order(legs)
+
     def square_off_position(self, payload):
         _ = payload
         return {"Status": 500, "Error": "square off rejected"}
@@ -506,6 +613,41 @@ def test_order_service_handles_failed_place_and_empty_execution_results():
     assert result["error"] == "No execution result returned"
 
 
+def test_order_service_normalizes_breeze_responses_once():
+    engine = FakeEngine()
+    service = OrderService(engine)
+
+    assert service.cancel_order("OID-7", "NFO") == {"success": True, "error": ""}
+    engine.cancel_order = lambda order_id, exchange_code: None
+    assert service.cancel_order("OID-7", "NFO")["success"] is False
+    assert OrderResult.from_breeze({"Status": 200, "Success": {"order_id": "SQ-1"}}) == OrderResult(True, "SQ-1")
+    assert OrderResult.from_breeze({"Status": 500, "Error": "rejected"}) == OrderResult(False, error="rejected")
+
+
+def test_order_route_places_through_async_workflow(tmp_path):
+    client = build_client(tmp_path)
+
+    response = client.post("/api/order", json={"stock_code": "NIFTY"})
+
+    assert response.json() == {"success": True, "order_id": "OID-0", "error": ""}
+
+
+def test_cancel_route_runs_on_dedicated_order_pool(tmp_path):
+    client = build_client(tmp_path)
+    engine = client.app.state.backend_state.engine
+    threads = []
+
+    def cancel_order(order_id, exchange_code):
+        threads.append(threading.current_thread().name)
+        return {"Status": 200, "Success": {"order_id": order_id}}
+
+    engine.cancel_order = cancel_order
+    response = client.post("/api/order/cancel", json={"order_id": "OID-9"})
+
+    assert response.json()["success"] is True
+    assert threads and threads[0].startswith("breeze-order")
+
+
 def test_preview_route_surfaces_execution_workflow_errors(tmp_path):
     connection = init_sqlite(tmp_path / "preview-error.db")
     engine = FakeEngine()
@@ -517,3 +659,598 @@ def test_preview_route_surfaces_execution_workflow_errors(tmp_path):
 
     assert response.status_code == 200
     assert response.json() == {"success": False, "error": "preview exploded"}
+
+
+def test_tick_store_merges_updates_into_option_chain_rows():
+    store = TickStore()
+    store.update("NIFTY:22000:CE", {"ltp": 110.0, "oi": 1200.0, "feed_time": "09:15:01"})
+    store.update("NIFTY:22000:CE", {"ltp": 112.5, "bid": 112.0})
+    store.update("NIFTY:SPOT", {"ltp": 22105.4, "is_spot": True, "source": "ws_tick"})
+    store.update("NIFTY:bad:CE", {"ltp": 1.0})
+
+    rows = store.to_option_chain_delta()
+    assert len(rows) == 1
+    assert rows[0]["stock_code"] == "NIFTY"
+    assert rows[0]["strike"] == 22000
+    assert rows[0]["right"] == "CE"
+    assert rows[0]["ltp"] == 112.5
+    assert rows[0]["oi"] == 1200.0
+    assert rows[0]["bid"] == 112.0
+    assert rows[0]["last_updated"] > 0
+    assert store.get_spot_prices() == {"NIFTY": 22105.4}
+
+    snapshot = store.get_all()
+    assert snapshot["version"] == 4
+    assert snapshot["ticks"]["NIFTY:22000:CE"]["feed_time"] == "09:15:01"
+    assert snapshot["ticks"]["NIFTY:SPOT"]["source"] == "ws_tick"
+
+    assert store.count == 3
+    version, changed = store.get_delta(1)
+    assert version == 4
+    assert [row["ltp"] for row in changed] == [112.5]
+    assert store.get_delta(4) == (4, [])
+
+    store.clear()
+    assert store.count == 0
+    assert store.to_option_chain_delta() == []
+    assert store.get_all() == {"ticks": {}, "version": 5}
+
+
+def test_tick_broadcaster_batches_updates_into_one_frame_per_flush():
+    engine = FakeEngine()
+    engine.tick_store = TickStore()
+    service = StreamService(engine, TickStoreFacade(engine.tick_store))
+
+    async def scenario():
+        broadcaster = TickBroadcaster(service, interval=3600)
+        first = broadcaster.register()
+        second = broadcaster.register()
+        for ltp in (100.0, 101.0, 102.0):
+            engine.tick_store.update("NIFTY:22000:CE", {"ltp": ltp})
+        broadcaster.flush()
+        broadcaster.flush()
+        assert first.qsize() == second.qsize() == 1
+        frame = json.loads(first.get_nowait())
+        assert frame["version"] == 3
+        assert [row["ltp"] for row in frame["ticks"]] == [102.0]
+
+        broadcaster.unregister(second)
+        for _ in range(33):
+            engine.tick_store.update("NIFTY:22000:PE", {"ltp": 50.0})
+            broadcaster.flush()
+        assert first.qsize() == 1
+        assert first.get_nowait() is RESYNC
+        broadcaster.unregister(first)
+        broadcaster._task.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_tick_broadcaster_resyncs_binary_clients_after_store_clear():
+    engine = FakeEngine()
+    engine.tick_store = TickStore()
+    service = StreamService(engine, TickStoreFacade(engine.tick_store))
+
+    async def scenario():
+        broadcaster = TickBroadcaster(service, interval=3600)
+        text = broadcaster.register()
+        binary = broadcaster.register(binary=True)
+        engine.tick_store.update("NIFTY:22000:CE", {"ltp": 100.0})
+        broadcaster.flush()
+        assert binary.qsize() == 2
+        while not binary.empty():
+            binary.get_nowait()
+        text.get_nowait()
+
+        engine.tick_store.clear()
+        engine.tick_store.update("BANKNIFTY:48000:CE", {"ltp": 301.0})
+        broadcaster.flush()
+        assert binary.qsize() == 1
+        assert binary.get_nowait() is RESYNC
+        assert json.loads(text.get_nowait())["ticks"][0]["stock_code"] == "BANKNIFTY"
+
+        engine.tick_store.update("BANKNIFTY:48000:CE", {"ltp": 302.0})
+        broadcaster.flush()
+        meta = json.loads(binary.get_nowait())
+        assert meta["type"] == "tick_meta" and meta["keys"] == {}
+        broadcaster.unregister(text)
+        broadcaster.unregister(binary)
+        broadcaster._task.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_tick_store_packs_changed_rows_into_binary_frame():
+    store = TickStore()
+    store.update("NIFTY:22000:CE", {"ltp": 110.0, "oi": 1200.0})
+    store.update("NIFTY:SPOT", {"ltp": 22105.4, "is_spot": True})
+    store.update("NIFTY:22000:PE", {"ltp": 95.5, "volume": 25000.0})
+
+    version, frame = store.pack_delta(1)
+    assert version == 3
+    assert TICK_FRAME_HEADER.unpack_from(frame)[0] == 3
+    assert len(frame) == TICK_FRAME_HEADER.size + TICK_STRUCT.size
+    row_id, ltp, oi, volume, *_ = TICK_STRUCT.unpack_from(frame, TICK_FRAME_HEADER.size)
+    assert (ltp, oi, volume) == (95.5, 0.0, 25000.0)
+
+    next_row, keys = store.key_table()
+    assert next_row == 3
+    assert keys == {"0": "NIFTY:22000:CE", str(row_id): "NIFTY:22000:PE"}
+    assert store.key_table(next_row) == (3, {})
+
+
+def test_execution_workflow_places_legs_concurrently_in_leg_order():
+    class OrderEngine:
+        connected = True
+
+        def place_order(self, leg):
+            time.sleep(0.01 * (3 - leg["idx"]))
+            if leg["idx"] == 1:
+                raise RuntimeError("rejected")
+            return {"Status": 200, "Success": {"order_id": f"OID-{leg['idx']}"}}
+
+        async def place_order_async(self, leg):
+            await asyncio.sleep(0.01 * (3 - leg["idx"]))
+            return self.place_order(leg)
+
+    legs = [{"idx": 0}, {"idx": 1}, {"idx": 2}]
+    workflow = ExecutionWorkflow(OrderEngine())
+
+    async def from_running_loop():
+        # The sync path must not start its own event loop.
+        return workflow.place_strategy_order(legs)
+
+    for results in (
+        asyncio.run(from_running_loop()),
+        asyncio.run(workflow.place_strategy_order_async(legs)),
+        get_order_executor().submit(workflow.place_strategy_order, legs).result(),
+    ):
+        assert [result["leg_index"] for result in results] == [0, 1, 2]
+        assert [result["success"] for result in results] == [True, False, True]
+        assert results[0]["order_id"] == "OID-0"
+        assert results[1]["error"] == "rejected"
+
+
+def test_execution_workflow_async_path_falls_back_to_sync_engine():
+    class SyncOnlyEngine:
+        connected = True
+
+        def place_order(self, leg):
+            return {"Status": 200, "Success": {"order_id": f"OID-{leg['idx']}"}}
+
+    results = asyncio.run(ExecutionWorkflow(SyncOnlyEngine()).place_strategy_order_async([{"idx": 0}, {"idx": 1}]))
+
+    assert [result["order_id"] for result in results] == ["OID-0", "OID-1"]
+    assert all(result["success"] for result in results)
+
+
+def test_realtime_manager_maps_breeze_tick_aliases():
+    engine = FakeEngine()
+    engine.tick_store = TickStore()
+    engine.log = logging.getLogger("test")
+    RealtimeManager(engine).on_ticks({
+        "stock_code": "NIFTY",
+        "strike_price": "22000",
+        "right": "Call",
+        "last_traded_price": "112.5",
+        "oi": 1500,
+        "best_bid_price": "112.0",
+        "ask_price": "113.0",
+        "exchange_feed_time": "09:15:01",
+    })
+
+    tick = engine.tick_store.get_all()["ticks"]["NIFTY:22000:CE"]
+    assert (tick["ltp"], tick["oi"], tick["bid"], tick["ask"], tick["iv"]) == (112.5, 1500.0, 112.0, 113.0, 0.0)
+    assert tick["feed_time"] == "09:15:01"
+
+
+def test_realtime_manager_writes_each_callback_as_one_coalesced_batch():
+    engine = FakeEngine()
+    engine.tick_store = TickStore()
+    engine.log = logging.getLogger("test")
+    notified = []
+    engine.tick_store.add_listener(lambda: notified.append(engine.tick_store.get_version()))
+
+    RealtimeManager(engine).on_ticks([
+        {"stock_code": "NIFTY", "strike_price": "22000", "right": "Call", "last_traded_price": "110"},
+        {"stock_code": "NIFTY", "strike_price": "22100", "right": "Put", "last_traded_price": "90"},
+        {"stock_code": "NIFTY", "strike_price": "22000", "right": "Call", "last_traded_price": "111"},
+    ])
+
+    assert notified == [1]
+    version, rows = engine.tick_store.get_delta(0)
+    assert version == 1
+    assert {(row["strike"], row["right"]): row["ltp"] for row in rows} == {(22000, "CE"): 111.0, (22100, "PE"): 90.0}
+
+
+def test_start_websocket_returns_as_soon_as_connect_settles():
+    class ConnectingBroker:
+        def __init__(self, error=None):
+            self.error = error
+
+        def set_on_ticks(self, callback):
+            _ = callback
+
+        def ws_connect(self):
+            time.sleep(0.05)
+            if self.error:
+                raise self.error
+
+    for broker, live in ((ConnectingBroker(), True), (ConnectingBroker(RuntimeError("refused")), False)):
+        engine = FakeEngine()
+        engine.ws_running = False
+        engine.log = logging.getLogger("test")
+        engine._ws_lock = threading.Lock()
+        engine._ws_thread = None
+        engine.broker_client = broker
+
+        started = time.monotonic()
+        RealtimeManager(engine).start_websocket()
+
+        assert time.monotonic() - started < 1.0
+        assert engine.ws_running is live
+
+
+def test_resubscribe_only_sends_the_changed_feeds():
+    class RecordingBroker:
+        def __init__(self):
+            self.calls = []
+
+        def subscribe_feeds(self, **kwargs):
+            self.calls.append(("sub", kwargs["strike_price"], kwargs["right"]))
+
+        def unsubscribe_feeds(self, **kwargs):
+            self.calls.append(("unsub", kwargs["strike_price"], kwargs["right"]))
+
+    engine = FakeEngine()
+    engine.subscribed = set()
+    engine.broker_client = RecordingBroker()
+    engine.realtime_manager = RealtimeManager(engine)
+    service = StreamService(engine, TickStoreFacade(engine.tick_store))
+
+    service.subscribe_option_chain("NIFTY", "NFO", "27-Mar-2026", [22000, 22100], ["Call"])
+    engine.broker_client.calls.clear()
+    result = service.subscribe_option_chain("NIFTY", "NFO", "27-Mar-2026", [22100, 22200], ["Call"])
+
+    assert sorted(engine.broker_client.calls) == [("sub", "22200", "Call"), ("unsub", "22000", "Call")]
+    assert (result["subscribed"], result["unsubscribed"], result["total_subs"]) == (1, 1, 2)
+
+
+def test_health_is_served_from_short_lived_cache():
+    engine = FakeEngine()
+    engine.tick_store = TickStore()
+    service = ConnectionService(engine, version="test")
+
+    first = service.health()
+    engine.tick_store.update("NIFTY:22000:CE", {"ltp": 1.0})
+    assert service.health() is first
+    assert first["tick_count"] == 0
+
+    service._health_cache = (0.0, first)
+    assert service.health()["tick_count"] == 1
+
+
+def test_stream_service_serializes_each_version_once():
+    engine = FakeEngine()
+    engine.tick_store = TickStore()
+    service = StreamService(engine, TickStoreFacade(engine.tick_store))
+    engine.tick_store.update("NIFTY:22000:CE", {"ltp": 100.0})
+
+    version, frame = service.tick_frame()
+    assert service.tick_frame() == (version, frame)
+    assert service.tick_frame()[1] is frame
+
+    engine.tick_store.update("NIFTY:22000:CE", {"ltp": 101.0})
+    assert json.loads(service.tick_frame()[1])["ticks"][0]["ltp"] == 101.0
+    assert json.loads(service.ticks_since_frame(2)) == {"changed": False, "version": 2}
+
+    status = service.status_frame()[1]
+    assert service.status_frame()[1] is status
+    assert json.loads(status) == {"type": "status", "version": 2, "count": 1, "ws_live": engine.ws_running}
+
+
+def test_stream_service_never_serves_a_pre_reconnect_frame():
+    engine = FakeEngine()
+    engine.tick_store = TickStore()
+    service = StreamService(engine, TickStoreFacade(engine.tick_store))
+    engine.tick_store.update("NIFTY:22000:CE", {"ltp": 100.0})
+    engine.tick_store.update("NIFTY:22100:CE", {"ltp": 90.0})
+    service.tick_frame()
+
+    engine.tick_store.clear()
+    engine.tick_store.update("BANKNIFTY:48000:CE", {"ltp": 301.0})
+    engine.tick_store.update("BANKNIFTY:48100:CE", {"ltp": 280.0})
+
+    ticks = json.loads(service.tick_frame()[1])["ticks"]
+    assert {row["stock_code"] for row in ticks} == {"BANKNIFTY"}
+
+
+def test_tick_broadcaster_wakes_on_store_writes_from_feed_thread():
+    engine = FakeEngine()
+    engine.tick_store = TickStore()
+    service = StreamService(engine, TickStoreFacade(engine.tick_store))
+
+    async def scenario():
+        broadcaster = TickBroadcaster(service, interval=0)
+        frames = broadcaster.register()
+        await asyncio.to_thread(engine.tick_store.update, "NIFTY:22000:CE", {"ltp": 99.0})
+        frame = json.loads(await asyncio.wait_for(frames.get(), timeout=1.0))
+        assert frame["ticks"][0]["ltp"] == 99.0
+        broadcaster.unregister(frames)
+        await asyncio.wait_for(broadcaster._task, timeout=1.0)
+        assert engine.tick_store._listeners == []
+
+    asyncio.run(scenario())
+
+
+def test_post_routes_reject_malformed_json_bodies(tmp_path):
+    client = build_client(tmp_path)
+
+    response = client.post("/api/order", content=b"{not json", headers={"content-type": "application/json"})
+    assert response.status_code == 400
+    assert response.json() == {"success": False, "error": "Invalid JSON"}
+
+
+def test_option_chain_and_quote_routes_serve_from_ttl_cache(tmp_path):
+    client = build_client(tmp_path)
+    engine = client.app.state.backend_state.engine
+    calls = []
+    fetch = engine.fetch_option_chain
+
+    def counting_fetch(*args):
+        calls.append(args)
+        return fetch(*args)
+
+    engine.fetch_option_chain = counting_fetch
+    params = {"stock_code": "NIFTY", "exchange_code": "NFO", "expiry_date": "27-Mar-2026", "right": "Call"}
+
+    first = client.get("/api/optionchain", params=params)
+    assert first.json()["count"] == 1
+    assert client.get("/api/optionchain", params=params).json()["count"] == 1
+    assert len(calls) == 1
+    revalidated = client.get("/api/optionchain", params=params, headers={"If-None-Match": first.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert first.headers["cache-control"] == "private, max-age=2"
+    assert revalidated.content == b""
+    client.get("/api/optionchain", params={**params, "no_cache": 1})
+    assert len(calls) == 2
+
+    quote_params = {**params, "strike_price": "22000"}
+    client.get("/api/quote", params=quote_params)
+    client.get("/api/quote", params=quote_params)
+
+    cache = client.get("/api/ratelimit").json()["cache"]
+    assert cache["option_chain"]["hits"] == 2
+    assert cache["option_chain"]["misses"] == 1
+    assert cache["quote"] == {"size": 1, "maxsize": 1024, "ttl_s": 5.0, "hits": 1, "misses": 1}
+
+
+def test_market_service_coalesces_concurrent_identical_requests():
+    engine = FakeEngine()
+    service = MarketService(engine)
+    calls = []
+
+    async def slow_fetch(*args):
+        calls.append(args)
+        await asyncio.sleep(0.01)
+        return engine.fetch_option_chain(*args)
+
+    engine.fetch_option_chain_async = slow_fetch
+
+    async def scenario():
+        args = ("NIFTY", "NFO", "27-Mar-2026", "Call", "")
+        results = await asyncio.gather(*(service.fetch_option_chain_async(*args, use_cache=False) for _ in range(5)))
+        assert all(result is results[0] for result in results)
+        assert service._flights.inflight == {}
+
+    asyncio.run(scenario())
+    assert len(calls) == 1
+
+
+def test_connection_changes_drop_cached_market_data():
+    engine = FakeEngine()
+    market = MarketService(engine)
+    connection = ConnectionService(engine, market_service=market)
+    args = ("NIFTY", "NFO", "27-Mar-2026", "Call", "")
+
+    first = market.fetch_option_chain(*args)
+    assert market.fetch_option_chain(*args) is first
+    connection.disconnect()
+    assert market.chain_cache.stats()["size"] == 0
+    assert market.fetch_option_chain(*args) is not first
+
+    cached = market.fetch_option_chain(*args)
+    connection.connect("key", "secret", "token")
+    assert market.fetch_option_chain(*args) is not cached
+
+
+def test_portfolio_service_coalesces_concurrent_book_polls():
+    engine = FakeEngine()
+    service = PortfolioService(engine)
+    calls = []
+
+    def slow_order_book():
+        calls.append(threading.current_thread().name)
+        time.sleep(0.02)
+        return {"Success": [{"order_id": "OID-1"}]}
+
+    engine.get_order_book = slow_order_book
+
+    async def scenario():
+        results = await asyncio.gather(*(service.fetch_async("orders") for _ in range(4)))
+        assert results == [[{"order_id": "OID-1"}]] * 4
+
+    asyncio.run(scenario())
+    assert len(calls) == 1
+
+
+def test_historical_route_streams_candles_across_batches(tmp_path):
+    client = build_client(tmp_path)
+    engine = client.app.state.backend_state.engine
+    candles = [{"datetime": f"2026-03-26 09:{idx % 60:02d}:00", "close": float(idx)} for idx in range(1201)]
+    engine.get_historical = lambda *args: candles
+
+    response = client.get("/api/historical", params={
+        "stock_code": "NIFTY",
+        "exchange_code": "NSE",
+        "from_date": "2026-03-01",
+        "to_date": "2026-03-26",
+    })
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == {"success": True, "data": candles}
+
+    assert "content-encoding" not in client.get("/ping").headers
+
+
+def test_api_routes_require_matching_terminal_token_when_auth_enabled(tmp_path):
+    state = BackendState(
+        engine=FakeEngine(),
+        version="test",
+        sqlite_connection=init_sqlite(tmp_path / "auth.db"),
+        auth_enabled=True,
+        backend_auth_token="s3cret",
+    )
+    client = TestClient(create_app(state))
+
+    assert client.get("/api/ratelimit").status_code == 401
+    assert client.get("/api/ratelimit", headers={"X-Terminal-Auth": "s3creT"}).status_code == 401
+    assert client.get("/api/ratelimit", headers={"x-terminal-auth": "s3cret"}).status_code == 200
+    assert client.get("/ping").status_code == 200
+
+
+def test_health_skips_auth_gate_and_cors_wraps_rejections(tmp_path):
+    state = BackendState(
+        engine=FakeEngine(),
+        version="test",
+        sqlite_connection=init_sqlite(tmp_path / "cors.db"),
+        auth_enabled=True,
+        backend_auth_token="s3cret",
+    )
+    client = TestClient(create_app(state))
+    origin = {"Origin": "https://terminal.example"}
+
+    health = client.get("/health", headers=origin)
+    assert health.status_code == 200
+    assert health.headers["access-control-allow-origin"] == "*"
+    assert state.connection_service.health_bytes() is state.connection_service.health_bytes()
+
+    rejected = client.get("/api/ratelimit", headers=origin)
+    assert rejected.status_code == 401
+    assert rejected.headers["access-control-allow-origin"] == "*"
+
+    preflight = client.options(
+        "/api/order",
+        headers={**origin, "Access-Control-Request-Method": "POST", "Access-Control-Request-Headers": "x-terminal-auth"},
+    )
+    assert preflight.status_code == 200
+    assert client.options("/api/order").status_code == 200
+
+
+def test_market_service_renders_each_cached_chain_once():
+    service = MarketService(FakeEngine())
+    args = ("NIFTY", "NFO", "27-Mar-2026", "Call", "")
+
+    async def scenario():
+        body = await service.option_chain_body_async(*args)
+        rows = await service.fetch_option_chain_async(*args)
+        assert json.loads(body) == {"success": True, "data": rows, "count": 1}
+        assert await service.option_chain_body_async(*args) is body
+
+        fresh = await service.option_chain_body_async(*args, use_cache=False)
+        assert fresh is not body
+        assert await service.option_chain_body_async(*args, use_cache=False) is not fresh
+
+    asyncio.run(scenario())
+
+
+def test_tick_store_builds_full_chain_once_per_version():
+    store = TickStore()
+    store.update("NIFTY:22000:CE", {"ltp": 112.5})
+
+    version, rows = store.get_delta(-1)
+    assert store.get_delta(0)[1] is rows
+    assert store.to_option_chain_delta() is rows
+    assert store.get_delta(version)[1] == []
+
+    store.update("NIFTY:22000:PE", {"ltp": 98.0})
+    assert len(store.to_option_chain_delta()) == 2
+
+    store.clear()
+    store.update("BANKNIFTY:48000:CE", {"ltp": 301.0})
+    store.update("BANKNIFTY:48000:PE", {"ltp": 287.0})
+    assert [row["stock_code"] for row in store.to_option_chain_delta()] == ["BANKNIFTY", "BANKNIFTY"]
+
+
+def test_tick_store_coerces_values_before_writing():
+    store = TickStore()
+    store.update("NIFTY:22000:CE", {"ltp": 110.0, "oi": 1200.0})
+    store.update("NIFTY:22000:CE", {"ltp": None, "oi": "1500", "bid": ""})
+    store.update_many({"NIFTY:22000:PE": {"ltp": "95.25", "volume": "n/a"}})
+
+    rows = {row["right"]: row for row in store.to_option_chain_delta()}
+    assert (rows["CE"]["ltp"], rows["CE"]["oi"], rows["CE"]["bid"]) == (110.0, 1500.0, 0.0)
+    assert (rows["PE"]["ltp"], rows["PE"]["volume"]) == (95.25, 0.0)
+    assert store.get_version() == 3
+
+
+def test_tick_store_clear_keeps_versions_moving_forward():
+    store = TickStore()
+    store.update("NIFTY:22000:CE", {"ltp": 112.5})
+    store.update("NIFTY:22000:PE", {"ltp": 98.0})
+    since_version = store.get_version()
+
+    store.clear()
+    assert store.get_version() > since_version
+    assert store.get_delta(since_version)[1] == []
+
+    store.update("BANKNIFTY:48000:CE", {"ltp": 301.0})
+    version, rows = store.get_delta(since_version)
+    assert version > since_version
+    assert [(row["stock_code"], row["strike"]) for row in rows] == [("BANKNIFTY", 48000)]
+
+
+def test_tick_store_drops_full_rows_built_across_a_clear():
+    store = TickStore()
+    store.update("NIFTY:22000:CE", {"ltp": 112.5})
+    chain_rows = TickStore._chain_rows
+
+    def clear_while_building(snapshot, since_version):
+        rows = chain_rows(snapshot, since_version)
+        store.clear()
+        return rows
+
+    store._chain_rows = clear_while_building
+    version, rows = store.get_delta(-1)
+    del store._chain_rows
+
+    assert [row["stock_code"] for row in rows] == ["NIFTY"]
+    assert store.get_version() > version
+    assert store.to_option_chain_delta() == []
+
+
+def test_executor_pool_sizes_fall_back_on_bad_environment(monkeypatch):
+    monkeypatch.setenv("ORDER_POOL", "")
+    assert _pool_size("ORDER_POOL", 4) == 4
+    monkeypatch.setenv("ORDER_POOL", "lots")
+    assert _pool_size("ORDER_POOL", 4) == 4
+    monkeypatch.setenv("ORDER_POOL", "0")
+    assert _pool_size("ORDER_POOL", 4) == 1
+    monkeypatch.setenv("ORDER_POOL", "6")
+    assert _pool_size("ORDER_POOL", 4) == 6
+
+
+def test_async_order_placement_runs_on_order_executor():
+    class ExecutorRateLimiter:
+        async def call(self, fn, *args, executor=None, **kwargs):
+            return await asyncio.get_running_loop().run_in_executor(executor, lambda: fn(*args, **kwargs))
+
+    class RecordingSdk:
+        def place_order(self, **kwargs):
+            return {"Status": 200, "Success": {"order_id": "OID-1"}, "thread": threading.current_thread().name}
+
+    client = BreezeBrokerClient(ExecutorRateLimiter())
+    client.set_sdk(RecordingSdk())
+    result = asyncio.run(client.place_order_async(stock_code="NIFTY"))
+    assert result["thread"].startswith("breeze-order")